@@ -11,7 +11,15 @@ class AuditRunner:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = setup_logger(__name__)
-        self.analyzer = WorkingAxeAnalyzer(config)
+        self.analyzer = self._create_analyzer(config)
+    
+    def _create_analyzer(self, config: Dict[str, Any]) -> WorkingAxeAnalyzer:
+        """Build the axe-core analyzer for the configured engine"""
+        engine = config.get('analysis', {}).get('engine', 'selenium')
+        if engine == 'playwright':
+            from .playwright_axe_analyzer import PlaywrightAxeAnalyzer
+            return PlaywrightAxeAnalyzer(config)
+        return WorkingAxeAnalyzer(config)
     
     async def run_audit(self, urls: List[str]) -> Dict[str, Any]:
         """Run accessibility audit with proper completion tracking"""
@@ -72,6 +80,8 @@ class AuditRunner:
         finally:
             # Ensure proper cleanup
             self.analyzer.shutdown()
+            if hasattr(self.analyzer, 'close'):
+                await self.analyzer.close()
     
     def _log_detailed_summary(self, report: Dict[str, Any]):
         """Log detailed summary of the audit results"""
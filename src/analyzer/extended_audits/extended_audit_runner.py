@@ -1,14 +1,17 @@
 # src/analyzer/extended_audits/extended_audit_runner.py
 import asyncio
+import queue
 import time
 from typing import List, Dict, Any
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 from ...core.exceptions import AnalysisException
 from ...utils.logger import setup_logger
+from ...utils.driver_utils import get_chromedriver_path
 from ..models.extended_audit_models import ExtendedAuditResult
 
 # Import the microservices
@@ -16,13 +19,49 @@ from .keyboard_audit import KeyboardAudit
 from .screen_reader_audit import ScreenReaderAudit
 from .landmark_audit import LandmarkAudit
 from .skip_link_audit import SkipLinkAudit
+from .base_audit import PAGE_HELPER_SCRIPT
 
 class ExtendedAuditRunner:
+    # Audit microservices in the order they are reported
+    SERVICE_CLASSES = {
+        "keyboard": KeyboardAudit,
+        "screen_reader": ScreenReaderAudit,
+        "landmark": LandmarkAudit,
+        "skip_link": SkipLinkAudit
+    }
+    
+    # Resources an accessibility audit never needs: web fonts, media and trackers
+    BLOCKED_URL_PATTERNS = [
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm",
+        "*googletagmanager*", "*google-analytics*", "*doubleclick*"
+    ]
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = setup_logger(__name__)
         self.driver = None
         self.audit_services = {}
+        self.parallel_services = config.get('extended_audit', {}).get('parallel_services', True)
+        
+        # Idle browsers kept for reuse by parallel services (shared by worker threads)
+        self._driver_pool: queue.Queue = queue.Queue()
+    
+    async def __aenter__(self) -> "ExtendedAuditRunner":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self):
+        """Close every browser kept alive between audits"""
+        await self._close_browser()
+        
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+            self._quit_driver(driver)
     
     async def run_extended_audit(self, url: str) -> ExtendedAuditResult:
         """Run extended accessibility audits and return defects"""
@@ -31,66 +70,17 @@ class ExtendedAuditRunner:
         try:
             self.logger.info(f"Starting extended audit for: {url}")
             
-            # Setup browser
-            await self._setup_browser()
-            
-            # Navigate to URL
-            self.logger.info(f"Navigating to: {url}")
-            self.driver.get(url)
-            
-            # Wait for page to stabilize
-            self.logger.info("Waiting for page to stabilize...")
-            await asyncio.sleep(5)
-            
-            # Initialize audit services
-            self._initialize_audit_services()
-            
-            # Run all extended audits sequentially to avoid overload
-            self.logger.info("Starting keyboard navigation audit...")
-            keyboard_defects = await self._run_audit_service("keyboard")
-            
-            self.logger.info("Starting screen reader audit...")
-            screen_reader_defects = await self._run_audit_service("screen_reader")
-            
-            self.logger.info("Starting landmark audit...")
-            landmark_defects = await self._run_audit_service("landmark")
-            
-            self.logger.info("Starting skip link audit...")
-            skip_link_defects = await self._run_audit_service("skip_link")
-            
-            # Create result object
-            result = ExtendedAuditResult(
-                url=url,
-                timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
-                keyboard_defects=keyboard_defects,
-                screen_reader_defects=screen_reader_defects,
-                landmark_defects=landmark_defects,
-                skip_link_defects=skip_link_defects
-            )
+            if self.parallel_services:
+                service_defects = await self._run_services_in_parallel(url)
+            else:
+                service_defects = await self._run_services_sequentially(url)
             
-            audit_duration = round(time.time() - start_time, 2)
-            
-            self.logger.info(
-                f"Extended audit completed for {url} in {audit_duration}s: "
-                f"Found {result.total_defects} defects "
-                f"(Keyboard: {len(keyboard_defects)}, "
-                f"Screen Reader: {len(screen_reader_defects)}, "
-                f"Landmark: {len(landmark_defects)}, "
-                f"Skip Links: {len(skip_link_defects)})"
-            )
-            
-            # Log defects by severity
-            severity_counts = result.defects_by_severity
-            if severity_counts:
-                self.logger.info("Defects by severity:")
-                for severity, count in severity_counts.items():
-                    if count > 0:
-                        self.logger.info(f"  {severity.value.upper()}: {count} defects")
-            
-            return result
+            return self._build_result(url, service_defects, start_time)
             
         except Exception as e:
             self.logger.error(f"Extended audit failed for {url}: {e}")
+            # The shared browser may be unusable now; start a fresh one for the next URL
+            await self._close_browser()
             return ExtendedAuditResult(
                 url=url,
                 timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -100,16 +90,148 @@ class ExtendedAuditRunner:
                 skip_link_defects=[],
                 error=str(e)
             )
+    
+    def audit_loaded_page(self, driver, url: str) -> ExtendedAuditResult:
+        """Run all audit services on a page another analyzer already loaded in driver
+        
+        Called from that analyzer's worker thread, so the services run one after another
+        on the caller's browser and no extra page load or browser is needed.
+        """
+        start_time = time.time()
+        self.logger.info(f"Starting extended audit on loaded page: {url}")
+        
+        service_defects = {}
+        for service_name, service_class in self.SERVICE_CLASSES.items():
+            try:
+                service_defects[service_name] = asyncio.run(service_class(driver, self.config).run_audit())
+            except Exception as e:
+                self.logger.error(f"Audit service {service_name} failed: {e}")
+                service_defects[service_name] = []
+        
+        return self._build_result(url, service_defects, start_time)
+    
+    def _build_result(self, url: str, service_defects: Dict[str, List[Any]], start_time: float) -> ExtendedAuditResult:
+        """Create the result object for a URL and log its summary"""
+        keyboard_defects = service_defects["keyboard"]
+        screen_reader_defects = service_defects["screen_reader"]
+        landmark_defects = service_defects["landmark"]
+        skip_link_defects = service_defects["skip_link"]
+        
+        result = ExtendedAuditResult(
+            url=url,
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+            keyboard_defects=keyboard_defects,
+            screen_reader_defects=screen_reader_defects,
+            landmark_defects=landmark_defects,
+            skip_link_defects=skip_link_defects
+        )
+        
+        audit_duration = round(time.time() - start_time, 2)
+        
+        self.logger.info(
+            f"Extended audit completed for {url} in {audit_duration}s: "
+            f"Found {result.total_defects} defects "
+            f"(Keyboard: {len(keyboard_defects)}, "
+            f"Screen Reader: {len(screen_reader_defects)}, "
+            f"Landmark: {len(landmark_defects)}, "
+            f"Skip Links: {len(skip_link_defects)})"
+        )
+        
+        # Log defects by severity
+        severity_counts = result.defects_by_severity
+        if severity_counts:
+            self.logger.info("Defects by severity:")
+            for severity, count in severity_counts.items():
+                if count > 0:
+                    self.logger.info(f"  {severity.value.upper()}: {count} defects")
+        
+        return result
+    
+    async def _run_services_sequentially(self, url: str) -> Dict[str, List[Any]]:
+        """Run all audit services one after another on a single browser session"""
+        # Setup browser once and keep it for following URLs
+        if self.driver is None:
+            await self._setup_browser()
+        
+        # Navigate to URL and wait for page to stabilize
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._load_page, self.driver, url)
+        
+        # Initialize audit services
+        self._initialize_audit_services()
+        
+        service_defects = {}
+        for service_name in self.SERVICE_CLASSES:
+            self.logger.info(f"Starting {service_name} audit...")
+            service_defects[service_name] = await self._run_audit_service(service_name)
+        
+        return service_defects
+    
+    async def _run_services_in_parallel(self, url: str) -> Dict[str, List[Any]]:
+        """Run every audit service concurrently, each on its own browser session"""
+        loop = asyncio.get_event_loop()
+        self.logger.info(f"Starting {len(self.SERVICE_CLASSES)} audit services in parallel...")
+        
+        results = await asyncio.gather(*[
+            loop.run_in_executor(None, self._run_service_in_session, service_name, url)
+            for service_name in self.SERVICE_CLASSES
+        ])
+        
+        return dict(zip(self.SERVICE_CLASSES, results))
+    
+    def _run_service_in_session(self, service_name: str, url: str) -> List[Any]:
+        """Run one audit service on a dedicated browser session (executed in a worker thread)"""
+        driver = None
+        try:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except queue.Empty:
+                driver = self._create_driver()
+            self._load_page(driver, url)
+            
+            service = self.SERVICE_CLASSES[service_name](driver, self.config)
+            self.logger.debug(f"Running {service_name} audit...")
+            defects = asyncio.run(service.run_audit())
+            
+            # Hand the healthy browser back for the next URL
+            self._driver_pool.put(driver)
+            driver = None
+            return defects
+        except Exception as e:
+            self.logger.error(f"Audit service {service_name} failed: {e}")
+            return []
         finally:
-            await self._close_browser()
+            if driver:
+                self._quit_driver(driver)
+    
+    def _load_page(self, driver, url: str):
+        """Navigate a driver to the URL and wait for the page to stabilize"""
+        self.logger.info(f"Navigating to: {url}")
+        driver.get(url)
+        
+        self.logger.info("Waiting for page to stabilize...")
+        try:
+            WebDriverWait(driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+            )
+            
+            # Network idle heuristic: resource count unchanged for 500ms
+            last_count = [-1]
+            def network_quiet(d):
+                count = d.execute_script("return performance.getEntriesByType('resource').length")
+                quiet = count == last_count[0]
+                last_count[0] = count
+                return quiet
+            
+            WebDriverWait(driver, 5, poll_frequency=0.5).until(network_quiet)
+        except TimeoutException:
+            self.logger.warning(f"Page did not settle in time, auditing current state: {url}")
     
     def _initialize_audit_services(self):
         """Initialize all audit services"""
         self.audit_services = {
-            "keyboard": KeyboardAudit(self.driver, self.config),
-            "screen_reader": ScreenReaderAudit(self.driver, self.config),
-            "landmark": LandmarkAudit(self.driver, self.config),
-            "skip_link": SkipLinkAudit(self.driver, self.config)
+            name: service_class(self.driver, self.config)
+            for name, service_class in self.SERVICE_CLASSES.items()
         }
     
     async def _run_audit_service(self, service_name: str) -> List[Any]:
@@ -126,6 +248,11 @@ class ExtendedAuditRunner:
     
     async def _setup_browser(self):
         """Setup Chrome browser for extended testing"""
+        self.driver = self._create_driver()
+        self.logger.info("Browser setup completed")
+    
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create a Chrome driver configured for extended testing"""
         chrome_options = Options()
         chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
@@ -140,17 +267,41 @@ class ExtendedAuditRunner:
         chrome_options.add_argument('--disable-images')
         chrome_options.add_argument('--blink-settings=imagesEnabled=false')
         
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+        # Return from get() at DOMContentLoaded; audits only need the parsed DOM
+        chrome_options.page_load_strategy = 'eager'
+        
+        driver = webdriver.Chrome(
+            service=Service(get_chromedriver_path()),
             options=chrome_options
         )
         
-        # Set timeouts
-        self.driver.implicitly_wait(10)
-        self.driver.set_page_load_timeout(30)
-        self.driver.set_script_timeout(30)
+        # Set timeouts (no implicit wait: empty element lookups must return immediately)
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(30)
+        driver.set_script_timeout(30)
         
-        self.logger.info("Browser setup completed")
+        # Block heavy resources and skip service workers to shorten page loads
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+            driver.execute_cdp_cmd("Network.setBypassServiceWorker", {"bypass": True})
+        except Exception as e:
+            self.logger.debug(f"Could not configure resource blocking: {e}")
+        
+        # Install the audit helpers on every page before its own scripts run
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PAGE_HELPER_SCRIPT})
+        except Exception as e:
+            self.logger.debug(f"Could not register page helpers: {e}")
+        
+        return driver
+    
+    def _quit_driver(self, driver):
+        """Quit a browser, logging instead of raising on failure"""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error closing browser: {e}")
     
     async def _close_browser(self):
         """Close browser instance"""
@@ -159,4 +310,6 @@ class ExtendedAuditRunner:
                 self.driver.quit()
                 self.logger.info("Browser closed successfully")
             except Exception as e:
-                self.logger.warning(f"Error closing browser: {e}")
\ No newline at end of file
+                self.logger.warning(f"Error closing browser: {e}")
+            finally:
+                self.driver = None
\ No newline at end of file
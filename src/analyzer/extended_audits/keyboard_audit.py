@@ -1,13 +1,68 @@
 # src/analyzer/extended_audits/keyboard_audit.py
-import asyncio
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import StaleElementReferenceException
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from .base_audit import BaseAudit
 from ..models.extended_audit_models import KeyboardDefect, SeverityLevel
 
+# Focuses every harvested element in turn and reports focus, focus indicator and
+# keyboard activation for all of them in one round-trip
+_KEYBOARD_PROBE_SCRIPT = """
+var results = {};
+arguments[0].forEach(function(idx) {
+    var result = {focused: false, focusIndicator: false, respondsToKeyboard: false};
+    results[idx] = result;
+    
+    var element = document.querySelector('[data-a11y-idx="' + idx + '"]');
+    if (!element) return;
+    
+    try {
+        var styles = window.getComputedStyle(element);
+        var outline = styles.outline;
+        var outlineWidth = styles.outlineWidth;
+        var border = styles.border;
+        
+        // Check for visible outline
+        var hasOutline = outline !== 'none' && outlineWidth !== '0px';
+        
+        // Focus the element and check for border changes on focus
+        element.focus();
+        result.focused = document.activeElement === element;
+        var hasBorderFocus = window.getComputedStyle(element).border !== border;
+        result.focusIndicator = hasOutline || hasBorderFocus;
+        
+        var tag = element.tagName.toLowerCase();
+        var role = element.getAttribute('role');
+        if (result.focused && (tag === 'button' || tag === 'a' || role === 'button' || role === 'link')) {
+            // Simulate Enter key press and see whether it activates the element
+            var clicked = false;
+            var clickHandler = function() { clicked = true; };
+            element.addEventListener('click', clickHandler);
+            element.dispatchEvent(new KeyboardEvent('keydown', {
+                key: 'Enter', keyCode: 13, which: 13, bubbles: true
+            }));
+            element.dispatchEvent(new KeyboardEvent('keyup', {
+                key: 'Enter', keyCode: 13, which: 13, bubbles: true
+            }));
+            element.removeEventListener('click', clickHandler);
+            result.respondsToKeyboard = clicked;
+        } else {
+            // For other elements, just check if focus worked
+            result.respondsToKeyboard = result.focused;
+        }
+        
+        element.blur();
+    } catch (e) {
+        // Ignore focus/blur errors
+    }
+});
+return results;
+"""
+
 class KeyboardAudit(BaseAudit):
+    # Tags and roles that make an element focusable without a tabindex
+    _NATURAL_FOCUSABLE = frozenset({'a', 'button', 'input', 'select', 'textarea', 'details', 'summary'})
+    _FOCUSABLE_ROLES = frozenset({'button', 'link', 'tab', 'menuitem'})
+    _INTERACTIVE_TAGS = frozenset({'a', 'button', 'input', 'select', 'textarea'})
+    
     async def run_audit(self) -> List[KeyboardDefect]:
         """Test keyboard navigation and return defects"""
         defects = []
@@ -20,67 +75,51 @@ class KeyboardAudit(BaseAudit):
                 "details", "summary", "[contenteditable='true']"
             ]
             
-            # Collect elements safely
-            all_elements = []
-            for selector in selectors:
-                elements = self._find_elements_safe(selector)
-                all_elements.extend(elements)
-                self.logger.debug(f"Found {len(elements)} elements with selector: {selector}")
+            # Harvest every candidate with one in-page query (querySelectorAll already de-duplicates)
+            records = self._harvest_elements(",".join(selectors))
+            self.logger.info(f"Testing {len(records)} unique focusable elements")
             
-            # Remove duplicates using selector strings instead of element objects
-            unique_elements = self._get_unique_elements(all_elements)
-            self.logger.info(f"Testing {len(unique_elements)} unique focusable elements")
+            # Probe focus and keyboard behaviour of all focusable elements in one script
+            focusable_records = [record for record in records if self._is_element_focusable(record)]
+            probe_results = self._probe_keyboard_support(focusable_records)
             
-            # Test each element with stale element protection
+            # Test each element from its harvested record
             tested_count = 0
-            for element in unique_elements:
+            for record in records:
                 try:
-                    element_defects = await self._test_element_keyboard_navigation(element)
+                    probe = probe_results.get(str(record['idx']))
+                    element_defects = await self._test_element_keyboard_navigation(record, probe)
                     defects.extend(element_defects)
                     tested_count += 1
-                except StaleElementReferenceException:
-                    self.logger.debug("Element became stale during testing, skipping...")
-                    continue
                 except Exception as e:
                     self.logger.warning(f"Failed to test element: {e}")
                     continue
             
-            self.logger.info(f"Successfully tested {tested_count}/{len(unique_elements)} elements")
+            self.logger.info(f"Successfully tested {tested_count}/{len(records)} elements")
             
         except Exception as e:
             self.logger.error(f"Keyboard navigation test failed: {e}")
         
         return defects
     
-    async def _test_element_keyboard_navigation(self, element) -> List[KeyboardDefect]:
-        """Test keyboard navigation for a single element and return defects"""
+    async def _test_element_keyboard_navigation(self, info: Dict[str, Any],
+                                                probe: Optional[Dict[str, Any]]) -> List[KeyboardDefect]:
+        """Test keyboard navigation for a single harvested element and return defects"""
         defects = []
         
         try:
-            # Refresh element reference to avoid staleness
-            selector = self._get_element_selector(element)
-            if not selector or selector == "unknown":
-                return defects
-            
-            refreshed_elements = self._find_elements_safe(selector)
-            if not refreshed_elements:
-                return defects  # Element no longer exists
-            
-            element = refreshed_elements[0]  # Use fresh element reference
-            
-            tag_name = self._safe_execute(lambda el: el.tag_name.lower(), element)
-            description = self._get_element_description(element)
-            
-            if not tag_name:
-                return defects
+            tag_name = info['tag']
+            description = self._describe_element_info(info)
+            selector = self._selector_from_info(info)
             
             # Check if focusable
-            is_focusable = await self._is_element_focusable(element)
+            is_focusable = self._is_element_focusable(info)
             
-            if is_focusable:
-                # Check for negative tabindex
-                tab_index = self._safe_execute(lambda el: el.get_attribute('tabindex'), element)
-                if tab_index and tab_index.isdigit() and int(tab_index) < 0:
+            if info.get('negativeTabindex') and info.get('displayed') and info.get('enabled'):
+                # Visible element removed from the tab order. Only a standalone control is a real
+                # break: skip link and programmatic focus targets (tabindex="-1" on main or a heading)
+                # and roving-tabindex items of composite widgets are valid patterns
+                if self._is_interactive(info) and not info.get('inCompositeWidget'):
                     defects.append(KeyboardDefect(
                         element_type=tag_name,
                         element_description=description,
@@ -89,10 +128,21 @@ class KeyboardAudit(BaseAudit):
                         recommendation="Remove negative tabindex or use positive values for logical focus order",
                         selector=selector
                     ))
+                else:
+                    defects.append(KeyboardDefect(
+                        element_type=tag_name,
+                        element_description=description,
+                        issue="Element removed from tab order with negative tabindex",
+                        severity=SeverityLevel.LOW,
+                        recommendation="Confirm the element is only a programmatic focus target or a widget item reachable with arrow keys",
+                        selector=selector
+                    ))
+            elif is_focusable:
+                # A missing probe result counts as a failed check
+                probe = probe or {}
                 
                 # Check visible focus
-                has_visible_focus = await self._has_visible_focus_indicator(element)
-                if not has_visible_focus:
+                if not probe.get('focusIndicator'):
                     defects.append(KeyboardDefect(
                         element_type=tag_name,
                         element_description=description,
@@ -102,9 +152,8 @@ class KeyboardAudit(BaseAudit):
                         selector=selector
                     ))
                 
-                # Test actual keyboard interaction
-                works_with_keyboard = await self._test_keyboard_interaction(element)
-                if not works_with_keyboard:
+                # Check actual keyboard interaction
+                if not probe.get('respondsToKeyboard'):
                     defects.append(KeyboardDefect(
                         element_type=tag_name,
                         element_description=description,
@@ -115,7 +164,7 @@ class KeyboardAudit(BaseAudit):
                     ))
             else:
                 # Element should be focusable but isn't
-                if tag_name in ['a', 'button', 'input', 'select', 'textarea']:
+                if tag_name in self._INTERACTIVE_TAGS:
                     defects.append(KeyboardDefect(
                         element_type=tag_name,
                         element_description=description,
@@ -125,158 +174,43 @@ class KeyboardAudit(BaseAudit):
                         selector=selector
                     ))
             
-        except StaleElementReferenceException:
-            self.logger.debug("Element became stale during detailed testing")
         except Exception as e:
             self.logger.warning(f"Failed to test element keyboard navigation: {e}")
         
         return defects
     
-    async def _is_element_focusable(self, element) -> bool:
-        """Check if element can receive focus with stale element protection"""
-        try:
-            # Check visibility and enabled state
-            is_displayed = self._safe_execute(lambda el: el.is_displayed(), element)
-            is_enabled = self._safe_execute(lambda el: el.is_enabled(), element)
-            
-            if not is_displayed or not is_enabled:
-                return False
-            
-            # Check tabindex
-            tabindex = self._safe_execute(lambda el: el.get_attribute('tabindex'), element)
-            if tabindex and tabindex.isdigit() and int(tabindex) < 0:
-                return False
-            
-            # Check if element is naturally focusable
-            tag_name = self._safe_execute(lambda el: el.tag_name.lower(), element)
-            naturally_focusable = tag_name in ['a', 'button', 'input', 'select', 'textarea', 'details', 'summary']
-            
-            # Check if element has explicit tabindex or role
-            has_tabindex = tabindex is not None
-            role = self._safe_execute(lambda el: el.get_attribute('role'), element)
-            has_focusable_role = role in ['button', 'link', 'tab', 'menuitem']
-            
-            return naturally_focusable or has_tabindex or has_focusable_role
-            
-        except StaleElementReferenceException:
-            return False
-        except Exception:
-            return False
+    def _is_interactive(self, info: Dict[str, Any]) -> bool:
+        """Check if element is a natively interactive tag or has an interactive role"""
+        return info.get('tag') in self._NATURAL_FOCUSABLE or info.get('role') in self._FOCUSABLE_ROLES
     
-    async def _has_visible_focus_indicator(self, element) -> bool:
-        """Check if element has visible focus indicator with stale element protection"""
-        try:
-            # Get computed styles for focus using JavaScript (more reliable)
-            selector = self._get_element_selector(element)
-            if not selector:
-                return False
-            
-            focus_script = f"""
-            var element = document.querySelector('{selector}');
-            if (!element) return false;
-            
-            var styles = window.getComputedStyle(element);
-            var outline = styles.outline;
-            var outlineWidth = styles.outlineWidth;
-            var border = styles.border;
-            
-            // Check for visible outline
-            var hasOutline = outline !== 'none' && outlineWidth !== '0px';
-            
-            // Check for border changes on focus
-            var hasBorderFocus = false;
-            try {{
-                element.focus();
-                var focusedStyles = window.getComputedStyle(element);
-                hasBorderFocus = focusedStyles.border !== border;
-                element.blur();
-            }} catch (e) {{
-                // Ignore focus/blur errors
-            }}
-            
-            return hasOutline || hasBorderFocus;
-            """
-            
-            result = self.driver.execute_script(focus_script)
-            return bool(result)
-            
-        except StaleElementReferenceException:
+    def _is_element_focusable(self, info: Dict[str, Any]) -> bool:
+        """Check if element can receive focus using prefetched element info"""
+        # Check visibility and enabled state
+        if not info.get('displayed') or not info.get('enabled'):
             return False
-        except Exception:
+        
+        # Check tabindex
+        tabindex = info.get('tabindex')
+        if info.get('negativeTabindex'):
             return False
+        
+        # Check if element is naturally focusable
+        tag_name = info.get('tag')
+        naturally_focusable = tag_name in self._NATURAL_FOCUSABLE
+        
+        # Check if element has explicit tabindex or role
+        has_tabindex = tabindex is not None
+        role = info.get('role')
+        has_focusable_role = role in self._FOCUSABLE_ROLES
+        
+        return naturally_focusable or has_tabindex or has_focusable_role
     
-    async def _test_keyboard_interaction(self, element) -> bool:
-        """Test if element responds to keyboard input with stale element protection"""
+    def _probe_keyboard_support(self, records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Run the keyboard probe for all records and return results keyed by data-a11y-idx"""
+        if not records:
+            return {}
         try:
-            selector = self._get_element_selector(element)
-            if not selector:
-                return False
-            
-            # Focus the element using JavaScript
-            focus_script = f"""
-            var element = document.querySelector('{selector}');
-            if (element) {{
-                element.focus();
-                return document.activeElement === element;
-            }}
-            return false;
-            """
-            
-            focus_result = self.driver.execute_script(focus_script)
-            if not focus_result:
-                return False
-            
-            # Small delay to ensure focus is applied
-            await asyncio.sleep(0.3)
-            
-            # Test interaction based on element type
-            tag_name = self._safe_execute(lambda el: el.tag_name.lower(), element)
-            role = self._safe_execute(lambda el: el.get_attribute('role'), element)
-            
-            if tag_name in ['button', 'a'] or role in ['button', 'link']:
-                # Test click simulation
-                click_script = f"""
-                var element = document.querySelector('{selector}');
-                if (!element) return false;
-                
-                var clicked = false;
-                var clickHandler = function() {{ clicked = true; }};
-                
-                element.addEventListener('click', clickHandler);
-                element.focus();
-                
-                // Simulate Enter key press
-                var enterEvent = new KeyboardEvent('keydown', {{ 
-                    key: 'Enter', 
-                    keyCode: 13, 
-                    which: 13,
-                    bubbles: true 
-                }});
-                element.dispatchEvent(enterEvent);
-                
-                var enterEventUp = new KeyboardEvent('keyup', {{ 
-                    key: 'Enter', 
-                    keyCode: 13, 
-                    which: 13,
-                    bubbles: true 
-                }});
-                element.dispatchEvent(enterEventUp);
-                
-                // Remove event listener
-                setTimeout(function() {{
-                    element.removeEventListener('click', clickHandler);
-                }}, 100);
-                
-                return clicked;
-                """
-                
-                click_result = self.driver.execute_script(click_script)
-                return bool(click_result)
-            
-            # For other elements, just check if focus worked
-            return focus_result
-            
-        except StaleElementReferenceException:
-            return False
-        except Exception:
-            return False
\ No newline at end of file
+            return self.driver.execute_script(_KEYBOARD_PROBE_SCRIPT, [record['idx'] for record in records]) or {}
+        except Exception as e:
+            self.logger.warning(f"Keyboard probe failed: {e}")
+            return {}
@@ -1,53 +1,97 @@
 # src/analyzer/extended_audits/landmark_audit.py
-import asyncio
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException
-from typing import List, Dict
-from .base_audit import BaseAudit
+from typing import List, Dict, Any
+from .base_audit import BaseAudit, PAGE_HELPER_SCRIPT
 from ..models.extended_audit_models import LandmarkDefect, LandmarkType, SeverityLevel
 
+# Standard HTML5 landmarks
+_LANDMARK_SELECTORS = (
+    (LandmarkType.BANNER, "header, [role='banner']"),
+    (LandmarkType.MAIN, "main, [role='main']"),
+    (LandmarkType.NAVIGATION, "nav, [role='navigation']"),
+    (LandmarkType.COMPLEMENTARY, "aside, [role='complementary']"),
+    (LandmarkType.CONTENTINFO, "footer, [role='contentinfo']"),
+    (LandmarkType.SEARCH, "[role='search']"),
+    (LandmarkType.FORM, "form, [role='form']"),
+    (LandmarkType.REGION, "section, [role='region']")
+)
+
+# Landmark types that need an accessible label, and roles that must not contain each other
+_LABELED_LANDMARKS = frozenset({LandmarkType.REGION, LandmarkType.FORM, LandmarkType.COMPLEMENTARY})
+_TOP_LEVEL_ROLES = frozenset({'banner', 'main', 'contentinfo'})
+
+# Page-level defects raised when a landmark type appears more than once: (type, issue, recommendation)
+_PAGE_STRUCTURE = "Page structure"
+_SINGLE_INSTANCE_LANDMARKS = (
+    (LandmarkType.BANNER,
+     "Multiple banner landmarks found",
+     "Ensure only one banner landmark per page"),
+    (LandmarkType.CONTENTINFO,
+     "Multiple contentinfo landmarks found",
+     "Ensure only one contentinfo landmark per page"),
+    (LandmarkType.NAVIGATION,
+     "Multiple navigation landmarks without distinguishing labels",
+     "Add aria-label to distinguish between multiple navigation landmarks")
+)
+
+# JSON-ready [type, selector] pairs passed to _LANDMARK_SCRIPT
+_LANDMARK_SCRIPT_ENTRIES = [[landmark_type.value, selector] for landmark_type, selector in _LANDMARK_SELECTORS]
+
+# Walks the DOM once with the combined landmark selector and classifies each match against
+# every type's selector (an element may be several landmark types). Returns element info plus
+# the ancestor role chain (outermost first) and a content check, so the audit needs no live elements
+_LANDMARK_SCRIPT = f"""
+{PAGE_HELPER_SCRIPT}
+var entries = arguments[0];
+var combined = entries.map(function(entry) {{ return entry[1]; }}).join(', ');
+var records = [];
+document.querySelectorAll(combined).forEach(function(el) {{
+    var info = window.__a11yElementInfo(el);
+    
+    info.ancestorRoles = [];
+    for (var node = el.parentElement; node; node = node.parentElement) {{
+        var role = node.getAttribute('role');
+        if (role) info.ancestorRoles.unshift(role);
+    }}
+    
+    // Visible text, child elements or images with alt text count as content
+    var visibleText = (el.textContent || '').replace(/\\s+/g, ' ').trim();
+    var hasMeaningfulImages = Array.from(el.getElementsByTagName('img')).some(function(img) {{
+        return img.alt && img.alt.trim().length > 0;
+    }});
+    info.hasContent = visibleText.length > 0 || el.children.length > 0 || hasMeaningfulImages;
+    
+    entries.forEach(function(entry) {{
+        if (el.matches(entry[1])) {{
+            records.push(Object.assign({{landmarkType: entry[0]}}, info));
+        }}
+    }});
+}});
+return records;
+"""
+
 class LandmarkAudit(BaseAudit):
     async def run_audit(self) -> List[LandmarkDefect]:
         """Check for proper landmark structure and return defects"""
         defects = []
         
         try:
-            # Standard HTML5 landmarks
-            landmark_selectors = {
-                LandmarkType.BANNER: "header, [role='banner']",
-                LandmarkType.MAIN: "main, [role='main']",
-                LandmarkType.NAVIGATION: "nav, [role='navigation']",
-                LandmarkType.COMPLEMENTARY: "aside, [role='complementary']",
-                LandmarkType.CONTENTINFO: "footer, [role='contentinfo']",
-                LandmarkType.SEARCH: "[role='search']",
-                LandmarkType.FORM: "form, [role='form']",
-                LandmarkType.REGION: "section, [role='region']"
-            }
-            
-            landmark_counts: Dict[LandmarkType, int] = {}
-            
-            for landmark_type, selector in landmark_selectors.items():
+            landmark_counts: Dict[LandmarkType, int] = {landmark_type: 0 for landmark_type, _ in _LANDMARK_SELECTORS}
+            
+            # Collect every landmark in one round-trip, then analyze the records in memory
+            records = self._collect_landmarks()
+            
+            for record in records:
+                landmark_type = LandmarkType(record['landmarkType'])
+                landmark_counts[landmark_type] += 1
                 try:
-                    elements = self._find_elements_safe(selector)
-                    landmark_counts[landmark_type] = len(elements)
-                    
-                    for element in elements:
-                        try:
-                            element_defects = await self._check_landmark_element(element, landmark_type)
-                            defects.extend(element_defects)
-                        except StaleElementReferenceException:
-                            self.logger.debug(f"Stale landmark element {landmark_type}, skipping...")
-                            continue
-                        except Exception as e:
-                            self.logger.warning(f"Failed to process landmark {landmark_type}: {e}")
-                            continue
-                            
+                    element_defects = self._check_landmark_element(record, landmark_type)
+                    defects.extend(element_defects)
                 except Exception as e:
-                    self.logger.warning(f"Failed to process landmark selector {selector}: {e}")
+                    self.logger.warning("Failed to process landmark %s: %s", landmark_type, e)
                     continue
             
             # Check for structural defects
-            structural_defects = await self._check_structural_issues(landmark_counts)
+            structural_defects = self._check_structural_issues(landmark_counts)
             defects.extend(structural_defects)
             
             self.logger.info(f"Landmark audit: found {len(defects)} defects across {len(landmark_counts)} landmark types")
@@ -57,35 +101,30 @@ class LandmarkAudit(BaseAudit):
         
         return defects
     
-    async def _check_landmark_element(self, element, landmark_type: LandmarkType) -> List[LandmarkDefect]:
-        """Check individual landmark element and return defects"""
+    def _collect_landmarks(self) -> List[Dict[str, Any]]:
+        """Fetch landmark records for every selector with one execute_script call"""
+        try:
+            return self.driver.execute_script(_LANDMARK_SCRIPT, _LANDMARK_SCRIPT_ENTRIES) or []
+        except Exception as e:
+            self.logger.warning(f"Failed to collect landmarks: {e}")
+            return []
+    
+    def _check_landmark_element(self, info: Dict[str, Any], landmark_type: LandmarkType) -> List[LandmarkDefect]:
+        """Check individual landmark record and return defects"""
         defects = []
         
         try:
-            # Refresh element reference
-            selector = self._get_element_selector(element)
-            if not selector or selector == "unknown":
-                return defects
-                
-            refreshed_elements = self._find_elements_safe(selector)
-            if not refreshed_elements:
-                return defects
-            
-            element = refreshed_elements[0]
-            
-            description = self._get_element_description(element)
+            selector = self._selector_from_info(info)
+            description = self._describe_element_info(info)
             
             # Check if landmark has a label
-            has_label = bool(self._safe_execute(lambda el: el.get_attribute('aria-label'), element) or 
-                           self._safe_execute(lambda el: el.get_attribute('aria-labelledby'), element))
-            
-            label_text = self._safe_execute(lambda el: el.get_attribute('aria-label'), element)
+            has_label = bool(info.get('aria') or info.get('labelledby'))
             
             # Check for uniqueness (we'll check this in structural issues)
             
             # Landmark-specific checks
             if not has_label:
-                if landmark_type in [LandmarkType.REGION, LandmarkType.FORM, LandmarkType.COMPLEMENTARY]:
+                if landmark_type in _LABELED_LANDMARKS:
                     defects.append(LandmarkDefect(
                         landmark_type=landmark_type,
                         element_description=description,
@@ -96,7 +135,7 @@ class LandmarkAudit(BaseAudit):
                     ))
             
             # Check if landmark is properly nested
-            nesting_issue = await self._check_landmark_nesting(element, landmark_type)
+            nesting_issue = self._check_landmark_nesting(landmark_type, info)
             if nesting_issue:
                 defects.append(LandmarkDefect(
                     landmark_type=landmark_type,
@@ -108,7 +147,7 @@ class LandmarkAudit(BaseAudit):
                 ))
             
             # Check if landmark has meaningful content
-            has_content = await self._landmark_has_content(element)
+            has_content = bool(info.get('hasContent'))
             if not has_content and landmark_type != LandmarkType.FORM:
                 defects.append(LandmarkDefect(
                     landmark_type=landmark_type,
@@ -119,14 +158,12 @@ class LandmarkAudit(BaseAudit):
                     selector=selector
                 ))
             
-        except StaleElementReferenceException:
-            self.logger.debug("Element became stale during landmark checking")
         except Exception as e:
-            self.logger.warning(f"Failed to check landmark element: {e}")
+            self.logger.warning("Failed to check landmark element: %s", e)
         
         return defects
     
-    async def _check_structural_issues(self, landmark_counts: Dict[LandmarkType, int]) -> List[LandmarkDefect]:
+    def _check_structural_issues(self, landmark_counts: Dict[LandmarkType, int]) -> List[LandmarkDefect]:
         """Check for structural landmark issues"""
         defects = []
         
@@ -135,52 +172,33 @@ class LandmarkAudit(BaseAudit):
             if LandmarkType.MAIN not in landmark_counts or landmark_counts[LandmarkType.MAIN] == 0:
                 defects.append(LandmarkDefect(
                     landmark_type=LandmarkType.MAIN,
-                    element_description="Page structure",
+                    element_description=_PAGE_STRUCTURE,
                     issue="Missing main landmark",
                     severity=SeverityLevel.HIGH,
                     recommendation="Add <main> element or role='main' to identify main content area"
                 ))
             
-            # Check for multiple banners
-            if landmark_counts.get(LandmarkType.BANNER, 0) > 1:
-                defects.append(LandmarkDefect(
-                    landmark_type=LandmarkType.BANNER,
-                    element_description="Page structure",
-                    issue="Multiple banner landmarks found",
-                    severity=SeverityLevel.MEDIUM,
-                    recommendation="Ensure only one banner landmark per page"
-                ))
-            
-            # Check for multiple contentinfo
-            if landmark_counts.get(LandmarkType.CONTENTINFO, 0) > 1:
-                defects.append(LandmarkDefect(
-                    landmark_type=LandmarkType.CONTENTINFO,
-                    element_description="Page structure",
-                    issue="Multiple contentinfo landmarks found",
-                    severity=SeverityLevel.MEDIUM,
-                    recommendation="Ensure only one contentinfo landmark per page"
-                ))
-            
-            # Check for navigation landmarks without labels when multiple exist
-            if landmark_counts.get(LandmarkType.NAVIGATION, 0) > 1:
-                defects.append(LandmarkDefect(
-                    landmark_type=LandmarkType.NAVIGATION,
-                    element_description="Page structure",
-                    issue="Multiple navigation landmarks without distinguishing labels",
-                    severity=SeverityLevel.MEDIUM,
-                    recommendation="Add aria-label to distinguish between multiple navigation landmarks"
-                ))
+            # Check for repeated banner, contentinfo and navigation landmarks
+            for landmark_type, issue, recommendation in _SINGLE_INSTANCE_LANDMARKS:
+                if landmark_counts.get(landmark_type, 0) > 1:
+                    defects.append(LandmarkDefect(
+                        landmark_type=landmark_type,
+                        element_description=_PAGE_STRUCTURE,
+                        issue=issue,
+                        severity=SeverityLevel.MEDIUM,
+                        recommendation=recommendation
+                    ))
             
         except Exception as e:
             self.logger.warning(f"Failed to check structural issues: {e}")
         
         return defects
     
-    async def _check_landmark_nesting(self, element, landmark_type: LandmarkType) -> str:
+    def _check_landmark_nesting(self, landmark_type: LandmarkType, info: Dict[str, Any]) -> str:
         """Check if landmark is properly nested"""
         try:
-            tag_name = self._safe_execute(lambda el: el.tag_name.lower(), element)
-            role = self._safe_execute(lambda el: el.get_attribute('role'), element)
+            tag_name = info['tag']
+            role = info.get('role')
             
             # Check for inappropriate nesting
             if landmark_type == LandmarkType.BANNER and tag_name != 'header':
@@ -190,55 +208,14 @@ class LandmarkAudit(BaseAudit):
                 return "Contentinfo role used on non-footer element"
             
             # Check for landmark inside landmark (some are allowed, some aren't)
-            parent_landmark = self._safe_execute(
-                lambda el: el.find_element(By.XPATH, "./ancestor::*[@role]"), 
-                element
-            )
-            
-            if parent_landmark:
-                parent_role = self._safe_execute(lambda el: el.get_attribute('role'), parent_landmark)
-                if parent_role in ['banner', 'main', 'contentinfo'] and landmark_type.value in ['banner', 'main', 'contentinfo']:
+            parent_roles = info.get('ancestorRoles') or []
+            
+            if parent_roles:
+                parent_role = parent_roles[0]
+                if parent_role in _TOP_LEVEL_ROLES and landmark_type.value in _TOP_LEVEL_ROLES:
                     return f"Landmark {landmark_type.value} nested inside {parent_role} landmark"
             
             return ""
             
         except Exception:
             return ""
-    
-    async def _landmark_has_content(self, element) -> bool:
-        """Check if landmark has meaningful content"""
-        try:
-            # Use JavaScript to check for visible content
-            selector = self._get_element_selector(element)
-            if not selector:
-                return False
-            
-            content_check_script = f"""
-            var element = document.querySelector('{selector}');
-            if (!element) return false;
-            
-            // Get all text content
-            var textContent = element.textContent || '';
-            var visibleText = textContent.replace(/\\s+/g, ' ').trim();
-            
-            // Check for child elements
-            var hasChildren = element.children.length > 0;
-            
-            // Check for images with alt text
-            var images = element.getElementsByTagName('img');
-            var hasMeaningfulImages = false;
-            for (var i = 0; i < images.length; i++) {{
-                if (images[i].alt && images[i].alt.trim().length > 0) {{
-                    hasMeaningfulImages = true;
-                    break;
-                }}
-            }}
-            
-            return visibleText.length > 0 || hasChildren || hasMeaningfulImages;
-            """
-            
-            result = self.driver.execute_script(content_check_script)
-            return bool(result)
-            
-        except Exception:
-            return False
\ No newline at end of file
@@ -1,11 +1,63 @@
 # src/analyzer/extended_audits/screen_reader_audit.py
-import asyncio
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException
-from typing import List
-from .base_audit import BaseAudit
+from typing import List, Dict, Any
+from .base_audit import BaseAudit, PAGE_HELPER_SCRIPT
 from ..models.extended_audit_models import ScreenReaderDefect, SeverityLevel
 
+# ARIA attributes that announce element state / value to screen readers
+_STATE_ATTRIBUTES = frozenset({
+    'aria-expanded', 'aria-pressed', 'aria-checked', 'aria-selected',
+    'aria-disabled', 'aria-hidden', 'aria-invalid', 'aria-required',
+    'aria-readonly', 'aria-busy'
+})
+_VALUE_ATTRIBUTES = frozenset({'aria-valuenow', 'aria-valuetext', 'aria-valuemin', 'aria-valuemax'})
+
+# Only these tags and roles can produce a screen reader defect; anything else is not probed
+_DEFECT_CAPABLE_TAGS = frozenset({
+    'img', 'button', 'a', 'input', 'select', 'textarea', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
+})
+_INTERACTIVE_ROLES = frozenset({'button', 'link', 'checkbox', 'radio', 'tab'})
+_FORM_TAGS = frozenset({'input', 'select', 'textarea'})
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+_DEFECT_CAPABLE_SELECTOR = ",".join(
+    sorted(_DEFECT_CAPABLE_TAGS) + [f"[role='{role}']" for role in sorted(_INTERACTIVE_ROLES)]
+)
+
+# Snapshot of every candidate exposed to assistive technology: element info plus everything the screen reader checks read
+# (attribute names, first image alt, associated labels), gathered in one round-trip
+_SCREEN_READER_HARVEST_SCRIPT = f"""
+{PAGE_HELPER_SCRIPT}
+// Ids referenced by any <label for>, collected once for the whole page
+var labelledIds = new Set(Array.from(document.querySelectorAll('label[for]')).map(function(label) {{
+    return label.htmlFor;
+}}));
+
+// Subtrees removed from the accessibility tree (aria-hidden or display:none), memoized per node
+var hiddenCache = new Map();
+function inHiddenSubtree(node) {{
+    if (!node || node.nodeType !== 1) return false;
+    if (hiddenCache.has(node)) return hiddenCache.get(node);
+    var hidden = node.getAttribute('aria-hidden') === 'true' ||
+                 window.getComputedStyle(node).display === 'none' ||
+                 inHiddenSubtree(node.parentElement);
+    hiddenCache.set(node, hidden);
+    return hidden;
+}}
+
+// Screen readers never announce hidden elements, so they are not audited
+return Array.from(document.querySelectorAll(arguments[0])).filter(function(el) {{
+    return !inHiddenSubtree(el) && window.getComputedStyle(el).visibility !== 'hidden';
+}}).map(function(el) {{
+    var info = window.__a11yElementInfo(el);
+    info.attributeNames = el.getAttributeNames();
+    
+    var img = el.querySelector('img');
+    info.firstImgAlt = img ? img.getAttribute('alt') : null;
+    info.hasLabelFor = !!el.id && labelledIds.has(el.id);
+    info.hasParentLabel = !!(el.parentElement && el.parentElement.closest('label'));
+    return info;
+}});
+"""
+
 class ScreenReaderAudit(BaseAudit):
     async def run_audit(self) -> List[ScreenReaderDefect]:
         """Test screen reader compatibility and return defects"""
@@ -20,24 +72,24 @@ class ScreenReaderAudit(BaseAudit):
                 "[aria-expanded]", "[aria-hidden]", "[aria-live]"
             ]
             
-            total_elements = 0
+            # One union query instead of one per selector; an element matching several selectors
+            # (e.g. a button with role and aria-label) is audited once. Elements that cannot
+            # produce a defect are filtered out by the browser.
+            query = f":is({','.join(selectors)}):is({_DEFECT_CAPABLE_SELECTOR})"
+            
+            # Snapshot all candidates in one round-trip, then run the rules in memory
+            records = self._collect_candidates(query)
+            total_elements = len(records)
             tested_elements = 0
             
-            for selector in selectors:
-                elements = self._find_elements_safe(selector)
-                total_elements += len(elements)
-                
-                for element in elements:
-                    try:
-                        element_defects = await self._test_element_screen_reader_support(element)
-                        defects.extend(element_defects)
-                        tested_elements += 1
-                    except StaleElementReferenceException:
-                        self.logger.debug(f"Stale element with selector {selector}, skipping...")
-                        continue
-                    except Exception as e:
-                        self.logger.warning(f"Failed to process element with selector {selector}: {e}")
-                        continue
+            for record in records:
+                try:
+                    element_defects = self._test_element_screen_reader_support(record)
+                    defects.extend(element_defects)
+                    tested_elements += 1
+                except Exception as e:
+                    self.logger.warning("Failed to process element: %s", e)
+                    continue
             
             self.logger.info(f"Screen reader audit: tested {tested_elements}/{total_elements} elements")
             
@@ -46,47 +98,35 @@ class ScreenReaderAudit(BaseAudit):
         
         return defects
     
-    async def _test_element_screen_reader_support(self, element) -> List[ScreenReaderDefect]:
-        """Test screen reader support for a single element and return defects"""
+    def _test_element_screen_reader_support(self, info: Dict[str, Any]) -> List[ScreenReaderDefect]:
+        """Test screen reader support for a single harvested element and return defects"""
         defects = []
         
         try:
-            # Refresh element reference
-            selector = self._get_element_selector(element)
-            if not selector or selector == "unknown":
-                return defects
-                
-            refreshed_elements = self._find_elements_safe(selector)
-            if not refreshed_elements:
-                return defects
+            selector = self._selector_from_info(info)
+            description = self._describe_element_info(info)
             
-            element = refreshed_elements[0]
+            tag_name = info['tag']
             
-            tag_name = self._safe_execute(lambda el: el.tag_name.lower(), element)
-            description = self._get_element_description(element)
-            
-            if not tag_name:
-                return defects
-            
-            # Check ARIA attributes with safe execution
-            has_aria_label = bool(self._safe_execute(lambda el: el.get_attribute('aria-label'), element))
-            has_aria_labelledby = bool(self._safe_execute(lambda el: el.get_attribute('aria-labelledby'), element))
-            has_aria_describedby = bool(self._safe_execute(lambda el: el.get_attribute('aria-describedby'), element))
+            # Check ARIA attributes
+            has_aria_label = bool(info.get('aria'))
+            has_aria_labelledby = bool(info.get('labelledby'))
+            has_aria_describedby = bool(info.get('describedby'))
             
             # Check alt text for images
             has_alt_text = False
             if tag_name == 'img':
-                has_alt_text = bool(self._safe_execute(lambda el: el.get_attribute('alt'), element))
+                has_alt_text = bool(info.get('alt'))
             
             # Check role
-            role = self._safe_execute(lambda el: el.get_attribute('role'), element)
+            role = info.get('role')
             role_present = bool(role)
             
             # Check state announcements
-            state_announced = await self._has_state_announcements(element)
+            state_announced = self._has_state_announcements(info)
             
             # Check value announcements for form elements
-            value_announced = await self._has_value_announcements(element)
+            value_announced = self._has_value_announcements(info)
             
             # Identify defects
             if tag_name == 'img' and not has_alt_text and not has_aria_label:
@@ -100,7 +140,7 @@ class ScreenReaderAudit(BaseAudit):
                 ))
             
             if tag_name == 'button':
-                button_text = self._safe_execute(lambda el: el.text.strip(), element)
+                button_text = info.get('text')
                 if (not button_text or len(button_text) == 0) and not has_aria_label and not has_aria_labelledby:
                     defects.append(ScreenReaderDefect(
                         element_type=tag_name,
@@ -112,17 +152,10 @@ class ScreenReaderAudit(BaseAudit):
                     ))
             
             if tag_name == 'a':
-                link_text = self._safe_execute(lambda el: el.text.strip(), element)
+                link_text = info.get('text')
                 if (not link_text or len(link_text) == 0) and not has_aria_label and not has_aria_labelledby:
                     # Check if it has an image with alt text
-                    img_elements = self._safe_execute(lambda el: el.find_elements(By.TAG_NAME, "img"), element)
-                    has_accessible_image = False
-                    if img_elements:
-                        for img in img_elements[:1]:  # Check first image only
-                            img_alt = self._safe_execute(lambda el: el.get_attribute('alt'), img)
-                            if img_alt:
-                                has_accessible_image = True
-                                break
+                    has_accessible_image = bool(info.get('firstImgAlt'))  # Check first image only
                     
                     if not has_accessible_image:
                         defects.append(ScreenReaderDefect(
@@ -134,7 +167,7 @@ class ScreenReaderAudit(BaseAudit):
                             selector=selector
                         ))
             
-            if role_present and role in ['button', 'link', 'checkbox', 'radio', 'tab']:
+            if role_present and role in _INTERACTIVE_ROLES:
                 if not state_announced:
                     defects.append(ScreenReaderDefect(
                         element_type=tag_name,
@@ -146,16 +179,14 @@ class ScreenReaderAudit(BaseAudit):
                     ))
             
             # Check for form elements without labels
-            if tag_name in ['input', 'select', 'textarea']:
+            if tag_name in _FORM_TAGS:
                 if not has_aria_label and not has_aria_labelledby:
                     # Check if there's an associated label
-                    input_id = self._safe_execute(lambda el: el.get_attribute('id'), element)
+                    input_id = info.get('id')
                     if input_id:
-                        label_elements = self._find_elements_safe(f"label[for='{input_id}']")
-                        if not label_elements:
+                        if not info.get('hasLabelFor'):
                             # Check for wrapping label
-                            parent_label = self._safe_execute(lambda el: el.find_element(By.XPATH, "./ancestor::label"), element)
-                            if not parent_label:
+                            if not info.get('hasParentLabel'):
                                 defects.append(ScreenReaderDefect(
                                     element_type=tag_name,
                                     element_description=description,
@@ -166,8 +197,8 @@ class ScreenReaderAudit(BaseAudit):
                                 ))
             
             # Check for empty headings
-            if tag_name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                heading_text = self._safe_execute(lambda el: el.text.strip(), element)
+            if tag_name in _HEADING_TAGS:
+                heading_text = info.get('text')
                 if not heading_text or len(heading_text) == 0:
                     defects.append(ScreenReaderDefect(
                         element_type=tag_name,
@@ -178,42 +209,23 @@ class ScreenReaderAudit(BaseAudit):
                         selector=selector
                     ))
             
-        except StaleElementReferenceException:
-            self.logger.debug("Element became stale during screen reader testing")
         except Exception as e:
-            self.logger.warning(f"Failed to test element screen reader support: {e}")
+            self.logger.warning("Failed to test element screen reader support: %s", e)
         
         return defects
     
-    async def _has_state_announcements(self, element) -> bool:
-        """Check if element has ARIA state announcements with stale protection"""
+    def _collect_candidates(self, query: str) -> List[Dict[str, Any]]:
+        """Fetch screen reader records for every element matching query with one execute_script call"""
         try:
-            states = [
-                'aria-expanded', 'aria-pressed', 'aria-checked', 'aria-selected',
-                'aria-disabled', 'aria-hidden', 'aria-invalid', 'aria-required',
-                'aria-readonly', 'aria-busy'
-            ]
-            for state in states:
-                state_value = self._safe_execute(lambda el: el.get_attribute(state), element)
-                if state_value is not None:  # Check if attribute exists (even if false)
-                    return True
-            return False
-        except StaleElementReferenceException:
-            return False
-        except Exception:
-            return False
+            return self.driver.execute_script(_SCREEN_READER_HARVEST_SCRIPT, query) or []
+        except Exception as e:
+            self.logger.warning(f"Failed to collect screen reader candidates: {e}")
+            return []
     
-    async def _has_value_announcements(self, element) -> bool:
-        """Check if element has value announcements with stale protection"""
-        try:
-            value_attributes = [
-                'aria-valuenow', 'aria-valuetext', 'aria-valuemin', 'aria-valuemax'
-            ]
-            for attr in value_attributes:
-                if self._safe_execute(lambda el: el.get_attribute(attr), element):
-                    return True
-            return False
-        except StaleElementReferenceException:
-            return False
-        except Exception:
-            return False
\ No newline at end of file
+    def _has_state_announcements(self, info: Dict[str, Any]) -> bool:
+        """Check if element has ARIA state announcements (attribute present, even if false)"""
+        return not _STATE_ATTRIBUTES.isdisjoint(info.get('attributeNames') or ())
+    
+    def _has_value_announcements(self, info: Dict[str, Any]) -> bool:
+        """Check if element has ARIA value announcements"""
+        return not _VALUE_ATTRIBUTES.isdisjoint(info.get('attributeNames') or ())
\ No newline at end of file
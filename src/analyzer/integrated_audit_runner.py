@@ -1,7 +1,11 @@
 # src/analyzer/integrated_audit_runner.py
 import asyncio
 import time
-from typing import List, Dict, Any
+from collections import Counter
+from dataclasses import fields
+from enum import Enum
+from operator import attrgetter
+from typing import List, Dict, Any, Tuple, Callable, Awaitable
 from ..utils.logger import setup_logger
 from .audit_runner import AuditRunner
 from .extended_audits.extended_audit_runner import ExtendedAuditRunner
@@ -9,6 +13,23 @@ from .working_axe_analyzer import WorkingAxeAnalyzer
 from .models.audit_models import PageAuditResult
 from .models.extended_audit_models import ExtendedAuditResult
 
+# Field names and a matching attrgetter per defect class, built on first use
+_DEFECT_FIELDS: Dict[type, Tuple[Tuple[str, ...], attrgetter]] = {}
+
+def _defect_to_dict(defect) -> Dict[str, Any]:
+    """Serialize a defect dataclass in field order, reporting enum fields by value"""
+    defect_class = type(defect)
+    spec = _DEFECT_FIELDS.get(defect_class)
+    if spec is None:
+        names = tuple(f.name for f in fields(defect_class))
+        spec = _DEFECT_FIELDS[defect_class] = (names, attrgetter(*names))
+    
+    names, getter = spec
+    return {
+        name: value.value if isinstance(value, Enum) else value
+        for name, value in zip(names, getter(defect))
+    }
+
 class IntegratedAuditRunner:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -23,27 +44,37 @@ class IntegratedAuditRunner:
         try:
             self.logger.info(f"Starting comprehensive audit for {len(urls)} URLs")
             
-            # Run axe-core audits
-            axe_results = await self.axe_runner.analyze_multiple_pages(urls)
+            # Run axe-core audits; with a shared session the extended audits run on each
+            # page right after axe-core, in the same browser, instead of loading it again
+            extended_by_url: Dict[str, ExtendedAuditResult] = {}
+            
+            def audit_loaded_page(driver, url):
+                # First result wins, so a hook that overran page_hook_timeout cannot replace
+                # the separate audit started for its URL in the meantime
+                extended_by_url.setdefault(url, self.extended_runner.audit_loaded_page(driver, url))
+            
+            share_session = self.config.get('extended_audit', {}).get('share_axe_session', True)
+            page_hook = audit_loaded_page if share_session else None
+            
+            # Axe results stream in as pages finish; extended audits for URLs the shared session
+            # did not cover (every URL when it is not shared) start right away and overlap the
+            # remaining axe-core work
+            audit_extended = self._bounded_extended_audit()
+            pending_extended = []
+            axe_results = []
+            async for page_result in self.axe_runner.analyze_pages_stream(urls, page_hook):
+                axe_results.append(page_result)
+                if page_result.url not in extended_by_url:
+                    pending_extended.append(asyncio.create_task(audit_extended(page_result.url)))
+            
+            # Report pages in the requested order rather than completion order
+            url_positions = {url: position for position, url in enumerate(urls)}
+            axe_results.sort(key=lambda result: url_positions.get(result.url, len(urls)))
             axe_report = self.axe_runner.generate_audit_report(axe_results)
             
-            # Run extended audits for each URL
-            extended_results = []
-            for url in urls:
-                try:
-                    extended_result = await self.extended_runner.run_extended_audit(url)
-                    extended_results.append(extended_result)
-                except Exception as e:
-                    self.logger.error(f"Extended audit failed for {url}: {e}")
-                    extended_results.append(ExtendedAuditResult(
-                        url=url,
-                        timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
-                        keyboard_defects=[],
-                        screen_reader_defects=[],
-                        landmark_defects=[],
-                        skip_link_defects=[],
-                        error=str(e)
-                    ))
+            for result in await asyncio.gather(*pending_extended):
+                extended_by_url.setdefault(result.url, result)
+            extended_results = [extended_by_url[url] for url in urls]
             
             # Combine results
             combined_report = self._combine_reports(axe_report, extended_results)
@@ -61,15 +92,46 @@ class IntegratedAuditRunner:
             raise
         finally:
             self.axe_runner.shutdown()
+            await self.extended_runner.close()
+    
+    def _bounded_extended_audit(self) -> Callable[[str], Awaitable[ExtendedAuditResult]]:
+        """Return a coroutine function running one URL's extended audit, max_parallel_urls at a time"""
+        extended_config = self.config.get('extended_audit', {})
+        max_parallel = extended_config.get('max_parallel_urls', 2) if self.extended_runner.parallel_services else 1
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+        
+        # Failed URLs are stamped with the audit start time, formatted once
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        async def audit_url(url: str) -> ExtendedAuditResult:
+            async with semaphore:
+                try:
+                    return await self.extended_runner.run_extended_audit(url)
+                except Exception as e:
+                    self.logger.error(f"Extended audit failed for {url}: {e}")
+                    return ExtendedAuditResult(
+                        url=url,
+                        timestamp=timestamp,
+                        keyboard_defects=[],
+                        screen_reader_defects=[],
+                        landmark_defects=[],
+                        skip_link_defects=[],
+                        error=str(e)
+                    )
+        
+        return audit_url
     
     def _combine_reports(self, axe_report: Dict[str, Any], extended_results: List[ExtendedAuditResult]) -> Dict[str, Any]:
         """Combine axe-core and extended audit results"""
         combined_report = axe_report.copy()
         
+        # Index extended results once instead of scanning them for every page
+        extended_by_url = {er.url: er for er in extended_results}
+        
         # Add extended results to page results
         for i, page_result in enumerate(combined_report['page_results']):
             url = page_result['url']
-            extended_result = next((er for er in extended_results if er.url == url), None)
+            extended_result = extended_by_url.get(url)
             
             if extended_result:
                 page_result['extended_audit'] = {
@@ -84,44 +146,10 @@ class IntegratedAuditRunner:
                         severity.value: count 
                         for severity, count in extended_result.defects_by_severity.items()
                     },
-                    'keyboard_defects': [
-                        {
-                            'element_type': defect.element_type,
-                            'element_description': defect.element_description,
-                            'issue': defect.issue,
-                            'severity': defect.severity.value,
-                            'recommendation': defect.recommendation,
-                            'selector': defect.selector
-                        } for defect in extended_result.keyboard_defects
-                    ],
-                    'screen_reader_defects': [
-                        {
-                            'element_type': defect.element_type,
-                            'element_description': defect.element_description,
-                            'issue': defect.issue,
-                            'severity': defect.severity.value,
-                            'recommendation': defect.recommendation,
-                            'selector': defect.selector
-                        } for defect in extended_result.screen_reader_defects
-                    ],
-                    'landmark_defects': [
-                        {
-                            'landmark_type': defect.landmark_type.value,
-                            'element_description': defect.element_description,
-                            'issue': defect.issue,
-                            'severity': defect.severity.value,
-                            'recommendation': defect.recommendation,
-                            'selector': defect.selector
-                        } for defect in extended_result.landmark_defects
-                    ],
-                    'skip_link_defects': [
-                        {
-                            'issue': defect.issue,
-                            'severity': defect.severity.value,
-                            'recommendation': defect.recommendation,
-                            'target_id': defect.target_id
-                        } for defect in extended_result.skip_link_defects
-                    ]
+                    'keyboard_defects': [_defect_to_dict(defect) for defect in extended_result.keyboard_defects],
+                    'screen_reader_defects': [_defect_to_dict(defect) for defect in extended_result.screen_reader_defects],
+                    'landmark_defects': [_defect_to_dict(defect) for defect in extended_result.landmark_defects],
+                    'skip_link_defects': [_defect_to_dict(defect) for defect in extended_result.skip_link_defects]
                 }
         
         # Update summary with extended defects
@@ -139,59 +167,66 @@ class IntegratedAuditRunner:
                 }
                 
                 # Calculate defects by severity across all extended audits
-                severity_counts = {}
+                severity_counts = Counter()
                 for er in successful_extended:
-                    for severity, count in er.defects_by_severity.items():
-                        severity_counts[severity.value] = severity_counts.get(severity.value, 0) + count
-                combined_report['summary']['extended_defects_by_severity'] = severity_counts
+                    severity_counts.update({severity.value: count for severity, count in er.defects_by_severity.items()})
+                combined_report['summary']['extended_defects_by_severity'] = dict(severity_counts)
         
         combined_report['metadata']['audit_type'] = 'comprehensive'
         
         return combined_report
 
     def _log_comprehensive_summary(self, report: Dict[str, Any]):
-        """Log comprehensive audit summary"""
+        """Log comprehensive audit summary as a single multi-line record"""
         summary = report['summary']
         
-        self.logger.info("=" * 70)
-        self.logger.info("COMPREHENSIVE ACCESSIBILITY AUDIT SUMMARY")
-        self.logger.info("=" * 70)
-        self.logger.info(f"Total URLs: {summary['total_pages']}")
-        self.logger.info(f"Successfully analyzed: {summary['pages_audited']}")
-        self.logger.info(f"Axe-Core Score: {summary['average_score']:.1f}%")
+        lines = [
+            "=" * 70,
+            "COMPREHENSIVE ACCESSIBILITY AUDIT SUMMARY",
+            "=" * 70,
+            f"Total URLs: {summary['total_pages']}",
+            f"Successfully analyzed: {summary['pages_audited']}",
+            f"Axe-Core Score: {summary['average_score']:.1f}%"
+        ]
         
         # Extended defects summary
         total_extended_defects = summary.get('total_extended_defects', 0)
-        self.logger.info(f"Extended Audit Defects: {total_extended_defects}")
+        lines.append(f"Extended Audit Defects: {total_extended_defects}")
         
         if total_extended_defects > 0:
             # Log defects by category
             defects_by_category = summary.get('extended_defects_by_category', {})
             if defects_by_category:
-                self.logger.info("Extended Defects by Category:")
-                for category, count in defects_by_category.items():
-                    if count > 0:
-                        self.logger.info(f"  - {category.replace('_', ' ').title()}: {count}")
+                lines.append("Extended Defects by Category:")
+                lines.extend(
+                    f"  - {category.replace('_', ' ').title()}: {count}"
+                    for category, count in defects_by_category.items() if count > 0
+                )
             
             # Log defects by severity
             defects_by_severity = summary.get('extended_defects_by_severity', {})
             if defects_by_severity:
-                self.logger.info("Extended Defects by Severity:")
-                for severity, count in defects_by_severity.items():
-                    if count > 0:
-                        self.logger.info(f"  - {severity.upper()}: {count}")
+                lines.append("Extended Defects by Severity:")
+                lines.extend(
+                    f"  - {severity.upper()}: {count}"
+                    for severity, count in defects_by_severity.items() if count > 0
+                )
         
         # Axe-core violations summary
         total_violations = summary.get('total_violations', 0)
-        self.logger.info(f"Axe-Core Violations: {total_violations}")
+        lines.append(f"Axe-Core Violations: {total_violations}")
         
         if total_violations > 0:
             violations_by_level = summary.get('violations_by_level', {})
             if violations_by_level:
-                self.logger.info("Axe Violations by Level:")
-                for level, count in violations_by_level.items():
-                    if count > 0:
-                        self.logger.info(f"  - {level.upper()}: {count}")
+                lines.append("Axe Violations by Level:")
+                lines.extend(
+                    f"  - {level.upper()}: {count}"
+                    for level, count in violations_by_level.items() if count > 0
+                )
+        
+        lines.append(f"Audit Duration: {summary['audit_duration']}s")
+        lines.append("=" * 70)
         
-        self.logger.info(f"Audit Duration: {summary['audit_duration']}s")
-        self.logger.info("=" * 70)
\ No newline at end of file
+        # One record, so handlers format and write the summary once
+        self.logger.info("\n".join(lines))
\ No newline at end of file
@@ -15,7 +15,16 @@ class WCAGVersion(Enum):
     WCAG21A = "wcag21a"
     WCAG21AA = "wcag21aa"
 
-@dataclass
+# Lookup tables used by every Violation, built once at import
+_IMPACT_LEVELS = {
+    'critical': ViolationLevel.CRITICAL,
+    'serious': ViolationLevel.SERIOUS,
+    'moderate': ViolationLevel.MODERATE,
+    'minor': ViolationLevel.MINOR
+}
+_WCAG_VERSIONS = {version.value: version for version in WCAGVersion}
+
+@dataclass(slots=True)
 class Violation:
     id: str
     impact: str
@@ -29,21 +38,15 @@ class Violation:
     
     def __post_init__(self):
         # Auto-calculate level based on impact
-        impact_levels = {
-            'critical': ViolationLevel.CRITICAL,
-            'serious': ViolationLevel.SERIOUS,
-            'moderate': ViolationLevel.MODERATE,
-            'minor': ViolationLevel.MINOR
-        }
-        self.level = impact_levels.get(self.impact.lower(), ViolationLevel.MINOR)
+        self.level = _IMPACT_LEVELS.get(self.impact.lower(), ViolationLevel.MINOR)
         
         # Extract WCAG version from tags
         for tag in self.tags:
-            if tag in [v.value for v in WCAGVersion]:
-                self.wcag_version = WCAGVersion(tag)
+            if tag in _WCAG_VERSIONS:
+                self.wcag_version = _WCAG_VERSIONS[tag]
                 break
 
-@dataclass
+@dataclass(slots=True)
 class PageAuditResult:
     # Fields without default values must come first
     url: str
@@ -72,7 +75,7 @@ class PageAuditResult:
         else:
             self.score = max(0, (len(self.passes) / total_elements) * 100)
 
-@dataclass
+@dataclass(slots=True)
 class AuditSummary:
     total_pages: int
     pages_audited: int
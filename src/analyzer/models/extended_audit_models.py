@@ -1,5 +1,6 @@
 # src/analyzer/models/extended_audit_models.py
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
@@ -25,7 +26,7 @@ class LandmarkType(Enum):
     FORM = "form"
     REGION = "region"
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardDefect:
     element_type: str
     element_description: str
@@ -34,7 +35,7 @@ class KeyboardDefect:
     recommendation: str
     selector: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ScreenReaderDefect:
     element_type: str
     element_description: str
@@ -43,7 +44,7 @@ class ScreenReaderDefect:
     recommendation: str
     selector: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class LandmarkDefect:
     landmark_type: LandmarkType
     element_description: str
@@ -52,7 +53,7 @@ class LandmarkDefect:
     recommendation: str
     selector: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class SkipLinkDefect:
     issue: str
     severity: SeverityLevel
@@ -69,14 +70,15 @@ class ExtendedAuditResult:
     skip_link_defects: List[SkipLinkDefect]
     error: Optional[str] = None
     
-    @property
+    # Defect lists are final once the result is built, so the derived totals are computed once
+    @cached_property
     def total_defects(self) -> int:
         return (len(self.keyboard_defects) + 
                 len(self.screen_reader_defects) + 
                 len(self.landmark_defects) + 
                 len(self.skip_link_defects))
     
-    @property
+    @cached_property
     def defects_by_severity(self) -> Dict[SeverityLevel, int]:
         severity_count = {level: 0 for level in SeverityLevel}
         
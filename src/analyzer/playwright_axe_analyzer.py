@@ -0,0 +1,118 @@
+# src/analyzer/playwright_axe_analyzer.py
+import time
+import asyncio
+import random
+from typing import Dict, Any, Optional, Callable
+from playwright.async_api import async_playwright, Browser, Error as PlaywrightError
+from axe_playwright_python.async_playwright import Axe
+from .working_axe_analyzer import WorkingAxeAnalyzer, AXE_RUN_OPTIONS
+from .models.audit_models import PageAuditResult
+
+class PlaywrightAxeAnalyzer(WorkingAxeAnalyzer):
+    """axe-core analyzer on Playwright's async API
+    
+    All pages share one Chromium process, each in its own browser context, and run on the
+    event loop instead of worker threads. page_hook is not supported: the extended audits
+    need a Selenium driver.
+    """
+    
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        
+        # Pages run on the event loop, so the inherited executor is never used
+        self.thread_pool.shutdown(wait=False)
+        self.thread_pool = None
+        
+        self.axe = Axe()
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._browser_lock = asyncio.Lock()
+    
+    async def _get_browser(self) -> Browser:
+        """Launch the shared browser on first use"""
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--disable-blink-features=AutomationControlled',
+                        '--no-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-gpu'
+                    ]
+                )
+            return self._browser
+    
+    async def _run_playwright_axe_analysis(self, url: str, start_time: float) -> PageAuditResult:
+        """Load url in a fresh context of the shared browser and run axe-core on it"""
+        browser = await self._get_browser()
+        context = await browser.new_context(user_agent=self.USER_AGENT)
+        try:
+            page = await context.new_page()
+        
+            self.logger.info(f"Navigating to: {url}")
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        
+            page_title = await page.title()
+            self.logger.info(f"Page title: {page_title}")
+        
+            self.logger.info(f"Running axe-core analysis for: {url}")
+            results = await self.axe.run(page, options=AXE_RUN_OPTIONS)
+        
+            return self._build_page_result(url, page_title, results.response, start_time)
+        finally:
+            await context.close()
+    
+    async def analyze_page(self, url: str,
+                           page_hook: Optional[Callable] = None) -> PageAuditResult:
+        """Analyze a single page with retry and timeout protection"""
+        if page_hook:
+            self.logger.warning("page_hook needs a Selenium driver and is ignored by the Playwright analyzer")
+        
+        start_time = time.time()
+        error = None
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.logger.info(f"Starting analysis for: {url} (attempt {attempt + 1})")
+                return await asyncio.wait_for(
+                    self._run_playwright_axe_analysis(url, start_time),
+                    timeout=self.timeout_per_page
+                )
+            except asyncio.TimeoutError:
+                error = f"Analysis timed out after {self.timeout_per_page}s"
+            except PlaywrightError as e:
+                error = f"Browser error: {str(e)}"
+            except Exception as e:
+                self.logger.error(f"Unexpected error analyzing {url}: {e}")
+                error = f"Analysis failed: {str(e)}"
+                break
+            
+            self.logger.warning(f"{error} for {url} (attempt {attempt + 1})")
+            if attempt < self.max_retries:
+                self.logger.info(f"Retrying {url} after {self.retry_delay}s delay...")
+                await asyncio.sleep(self.retry_delay + random.uniform(1, 3))  # Add jitter
+        
+        return PageAuditResult(
+            url=url,
+            page_title="Error - Analysis failed",
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+            violations=[],
+            passes=[],
+            incomplete=[],
+            inapplicable=[],
+            error=error,
+            load_time=time.time() - start_time
+        )
+    
+    async def close(self):
+        """Close the shared browser and stop Playwright"""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
@@ -1,6 +1,8 @@
 # src/analyzer/result_processor.py
 import json
+import heapq
 import time
+from operator import itemgetter
 from typing import List, Dict, Any
 from pathlib import Path
 from ..utils.logger import setup_logger
@@ -62,71 +64,50 @@ class ResultProcessor:
             self.logger.error(f"Failed to save comprehensive results: {e}")
             raise
     
-    def _make_serializable(self, obj: Any) -> Any:
-        """Convert non-serializable objects to serializable formats"""
-        if isinstance(obj, dict):
-            return {k: self._make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif isinstance(obj, (str, int, float, bool)) or obj is None:
-            return obj
-        elif hasattr(obj, '__dict__'):
-            # Convert objects to dict
-            return self._make_serializable(obj.__dict__)
-        else:
-            # Convert to string as fallback
-            return str(obj)
-    
     def generate_console_report(self, audit_report: Dict[str, Any]):
         """Generate console-friendly audit report"""
         summary = audit_report.get('summary', {})
         categorization = audit_report.get('categorization', {})
+        get = summary.get
         
         report_lines = [
             "🚀 ACCESSIBILITY AUDIT REPORT",
             "=" * 50,
-            f"Total Pages: {summary.get('total_pages', 0)}",
-            f"Pages Audited: {summary.get('pages_audited', 0)}",
-            f"Total Violations: {summary.get('total_violations', 0)}",
-            f"Average Score: {summary.get('average_score', 0):.1f}%",
-            f"Best Score: {summary.get('best_score', 0):.1f}%",
-            f"Worst Score: {summary.get('worst_score', 0):.1f}%",
-            f"Audit Duration: {summary.get('audit_duration', 0):.1f}s",
+            f"Total Pages: {get('total_pages', 0)}",
+            f"Pages Audited: {get('pages_audited', 0)}",
+            f"Total Violations: {get('total_violations', 0)}",
+            f"Average Score: {get('average_score', 0):.1f}%",
+            f"Best Score: {get('best_score', 0):.1f}%",
+            f"Worst Score: {get('worst_score', 0):.1f}%",
+            f"Audit Duration: {get('audit_duration', 0):.1f}s",
             "",
             "📊 VIOLATIONS BY LEVEL:"
         ]
         
         # Add violations by level
-        violations_by_level = summary.get('violations_by_level', {})
-        for level, count in violations_by_level.items():
-            report_lines.append(f"  • {level.upper()}: {count}")
+        report_lines.extend(
+            f"  • {level.upper()}: {count}"
+            for level, count in get('violations_by_level', {}).items()
+        )
         
         # Add extended defects if available
         if 'total_extended_defects' in summary:
             report_lines.append(f"\n🔴 EXTENDED AUDIT DEFECTS: {summary['total_extended_defects']}")
-            defects_by_category = summary.get('extended_defects_by_category', {})
-            for category, count in defects_by_category.items():
-                if count > 0:
-                    report_lines.append(f"  • {category.replace('_', ' ').title()}: {count}")
+            report_lines.extend(
+                f"  • {category.replace('_', ' ').title()}: {count}"
+                for category, count in get('extended_defects_by_category', {}).items() if count > 0
+            )
         
         # Add top violating rules
         report_lines.append("\n🔴 TOP VIOLATING RULES:")
-        violations_by_rule = summary.get('violations_by_rule', {})
-        sorted_rules = sorted(
-            violations_by_rule.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
-        
-        for rule_id, count in sorted_rules:
-            report_lines.append(f"  • {rule_id}: {count} violations")
+        top_rules = heapq.nlargest(5, get('violations_by_rule', {}).items(), key=itemgetter(1))
+        report_lines.extend(f"  • {rule_id}: {count} violations" for rule_id, count in top_rules)
         
         # Add pages with errors if any
-        pages_with_errors = summary.get('pages_with_errors', [])
+        pages_with_errors = get('pages_with_errors', [])
         if pages_with_errors:
             report_lines.append(f"\n❌ PAGES WITH ERRORS ({len(pages_with_errors)}):")
-            for url in pages_with_errors[:3]:
-                report_lines.append(f"  • {url}")
+            report_lines.extend(f"  • {url}" for url in pages_with_errors[:3])
             if len(pages_with_errors) > 3:
                 report_lines.append(f"  • ... and {len(pages_with_errors) - 3} more")
         
@@ -1,72 +1,77 @@
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Optional
 from .models.audit_models import Violation, ViolationLevel, AuditSummary, PageAuditResult
 from ..utils.logger import setup_logger
 
+# Known axe-core rules with their report category and priority
+_RULE_METADATA = {
+    'color-contrast': {
+        'category': 'Visual Design',
+        'priority': ViolationLevel.SERIOUS,
+        'description': 'Ensure text has sufficient color contrast'
+    },
+    'image-alt': {
+        'category': 'Images',
+        'priority': ViolationLevel.CRITICAL,
+        'description': 'Images must have alternate text'
+    },
+    'button-name': {
+        'category': 'Forms',
+        'priority': ViolationLevel.CRITICAL,
+        'description': 'Buttons must have discernible text'
+    },
+    'link-name': {
+        'category': 'Navigation',
+        'priority': ViolationLevel.SERIOUS,
+        'description': 'Links must have discernible text'
+    },
+    'html-has-lang': {
+        'category': 'Structure',
+        'priority': ViolationLevel.SERIOUS,
+        'description': 'HTML element must have a lang attribute'
+    },
+    'label': {
+        'category': 'Forms',
+        'priority': ViolationLevel.CRITICAL,
+        'description': 'Form elements must have labels'
+    }
+}
+
+# Flat rule ID -> category lookup, built once at import
+_RULE_TO_CATEGORY = {rule_id: metadata['category'] for rule_id, metadata in _RULE_METADATA.items()}
+
 class ViolationCategorizer:
+    # Zeroed per-level counts, copied per call so every level is reported, including empty ones
+    _EMPTY_BY_LEVEL = {level.value: 0 for level in ViolationLevel}
+    _EMPTY_BY_LEVEL_ENUM = dict.fromkeys(ViolationLevel, 0)
+    
     def __init__(self):
         self.logger = setup_logger(__name__)
-        self.rule_metadata = {
-            'color-contrast': {
-                'category': 'Visual Design',
-                'priority': ViolationLevel.SERIOUS,
-                'description': 'Ensure text has sufficient color contrast'
-            },
-            'image-alt': {
-                'category': 'Images',
-                'priority': ViolationLevel.CRITICAL,
-                'description': 'Images must have alternate text'
-            },
-            'button-name': {
-                'category': 'Forms',
-                'priority': ViolationLevel.CRITICAL,
-                'description': 'Buttons must have discernible text'
-            },
-            'link-name': {
-                'category': 'Navigation',
-                'priority': ViolationLevel.SERIOUS,
-                'description': 'Links must have discernible text'
-            },
-            'html-has-lang': {
-                'category': 'Structure',
-                'priority': ViolationLevel.SERIOUS,
-                'description': 'HTML element must have a lang attribute'
-            },
-            'label': {
-                'category': 'Forms',
-                'priority': ViolationLevel.CRITICAL,
-                'description': 'Form elements must have labels'
-            }
-        }
+        self.rule_metadata = _RULE_METADATA
     
     def categorize_violations(self, violations: List[Violation]) -> Dict[str, Any]:
         """Categorize violations by type, level, and WCAG version"""
-        categorized = {
-            'by_level': {},
-            'by_rule': {},
-            'by_wcag': {},
-            'by_category': {}
-        }
+        # One C-level counting pass per aggregation
+        by_level = Counter(violation.level.value for violation in violations)
+        by_rule = Counter(violation.id for violation in violations)
+        by_wcag = Counter(
+            violation.wcag_version.value for violation in violations if violation.wcag_version
+        )
         
-        # Initialize categories
-        for level in ViolationLevel:
-            categorized['by_level'][level.value] = 0
+        # Categories follow from rule IDs, so resolve each distinct rule once
+        by_category = Counter()
+        for rule_id, count in by_rule.items():
+            by_category[_RULE_TO_CATEGORY.get(rule_id, 'Other')] += count
         
-        for violation in violations:
-            # Count by level
-            categorized['by_level'][violation.level.value] += 1
-            
-            # Count by rule ID
-            rule_id = violation.id
-            categorized['by_rule'][rule_id] = categorized['by_rule'].get(rule_id, 0) + 1
-            
-            # Count by WCAG version
-            if violation.wcag_version:
-                wcag_key = violation.wcag_version.value
-                categorized['by_wcag'][wcag_key] = categorized['by_wcag'].get(wcag_key, 0) + 1
-            
-            # Count by category
-            category = self.rule_metadata.get(rule_id, {}).get('category', 'Other')
-            categorized['by_category'][category] = categorized['by_category'].get(category, 0) + 1
+        by_level_counts = self._EMPTY_BY_LEVEL.copy()
+        by_level_counts.update(by_level)
+        
+        categorized = {
+            'by_level': by_level_counts,
+            'by_rule': dict(by_rule),
+            'by_wcag': dict(by_wcag),
+            'by_category': dict(by_category)
+        }
         
         return categorized
     
@@ -78,30 +83,28 @@ class ViolationCategorizer:
             'description': 'No additional information available'
         })
     
-    def generate_summary(self, audit_results: List[PageAuditResult]) -> AuditSummary:
-        """Generate comprehensive audit summary - FIXED VERSION"""
+    def generate_summary(self, audit_results: List[PageAuditResult],
+                         successful_results: Optional[List[PageAuditResult]] = None,
+                         failed_results: Optional[List[PageAuditResult]] = None) -> AuditSummary:
+        """Generate comprehensive audit summary, reusing the caller's error partition when given"""
         total_pages = len(audit_results)
-        successful_results = [r for r in audit_results if not r.error]
+        if successful_results is None or failed_results is None:
+            successful_results, failed_results = [], []
+            for result in audit_results:
+                (failed_results if result.error else successful_results).append(result)
         pages_audited = len(successful_results)
         
-        total_violations = 0
-        violations_by_level = {level: 0 for level in ViolationLevel}
-        violations_by_rule = {}
-        scores = []
-        pages_with_errors = []
+        pages_with_errors = [r.url for r in failed_results]
+        
+        # Each aggregation is one pass over the successful pages
+        scores = [r.score for r in successful_results]
+        total_violations = sum(len(r.violations) for r in successful_results)
+        level_counts = Counter(v.level for r in successful_results for v in r.violations)
+        rule_counts = Counter(v.id for r in successful_results for v in r.violations)
         
-        for result in audit_results:
-            if result.error:
-                pages_with_errors.append(result.url)
-            else:
-                total_violations += len(result.violations)
-                scores.append(result.score)
-                
-                # Count violations by level and rule
-                for violation in result.violations:
-                    violations_by_level[violation.level] = violations_by_level.get(violation.level, 0) + 1
-                    rule_id = violation.id
-                    violations_by_rule[rule_id] = violations_by_rule.get(rule_id, 0) + 1
+        violations_by_level = self._EMPTY_BY_LEVEL_ENUM.copy()
+        violations_by_level.update(level_counts)
+        violations_by_rule = dict(rule_counts)
         
         avg_score = sum(scores) / len(scores) if scores else 0
         worst_score = min(scores) if scores else 0
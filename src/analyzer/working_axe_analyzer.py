@@ -1,21 +1,99 @@
 # src/analyzer/working_axe_analyzer.py
+import json
+import atexit
+import weakref
+from collections import defaultdict
+from urllib.parse import urlparse
 import time
 import asyncio
 import random
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from axe_selenium_python import Axe
 from ..core.exceptions import AnalysisException
 from ..utils.logger import setup_logger
+from ..utils.driver_utils import get_chromedriver_path
 from .models.audit_models import PageAuditResult, Violation
 from .violation_categorizer import ViolationCategorizer
 
+# orjson is optional; when installed, axe-core results are parsed in C
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only violations need their matching nodes; passes, incomplete and inapplicable keep every rule
+# entry (the score counts passing rules) but carry at most one node each
+AXE_RUN_OPTIONS = {'resultTypes': ['violations']}
+
+# Runs axe-core and hands back its results as one JSON string, so the nested node arrays are
+# decoded in a single parse rather than rebuilt value by value by the WebDriver client
+_AXE_RUN_SCRIPT = """
+var options = arguments[0], callback = arguments[arguments.length - 1];
+axe.run(document, options).then(function(results) {
+    callback(JSON.stringify(results));
+}, function(error) {
+    callback(JSON.stringify({error: String(error)}));
+});
+"""
+
+def _violation_to_dict(v: Violation) -> Dict[str, Any]:
+    """Report entry for one violation"""
+    return {
+        'id': v.id,
+        'impact': v.impact,
+        'level': v.level.value if hasattr(v.level, 'value') else str(v.level),
+        'description': v.description,
+        'help': v.help,
+        'help_url': v.help_url,
+        'nodes_count': len(v.nodes),
+        'tags': v.tags,  # Include tags for WCAG criteria extraction
+        'nodes': v.nodes  # Include nodes for element selector extraction
+    }
+
+def _page_to_dict(result: PageAuditResult) -> Dict[str, Any]:
+    """Report entry for one analyzed page"""
+    return {
+        'url': result.url,
+        'page_title': result.page_title,  # Include page title in report
+        'score': result.score,
+        'violation_count': len(result.violations),
+        'error': result.error,
+        'load_time': round(result.load_time, 2),
+        'timestamp': result.timestamp,
+        'violations': [_violation_to_dict(v) for v in result.violations]
+    }
+
+# Requests the audits never need; axe-core and the extended audits work on the DOM, and images
+# are already disabled by the browser flags
+_BLOCKED_ASSET_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3'
+]
+# Stylesheets decide color contrast and visibility, so they are only blocked on request
+_BLOCKED_STYLESHEET_URLS = ['*.css']
+
+# Analyzers with browsers that may still be running; any left at interpreter exit have them quit
+_live_analyzers: "weakref.WeakSet[WorkingAxeAnalyzer]" = weakref.WeakSet()
+
+@atexit.register
+def _quit_leftover_drivers():
+    """Quit the browsers of analyzers that were never shut down"""
+    for analyzer in list(_live_analyzers):
+        analyzer._quit_drivers()
+
 class WorkingAxeAnalyzer:
+    # axe-core source from the axe_selenium_python bundle, read once per process
+    _axe_source: Optional[str] = None
+    _axe_source_lock = threading.Lock()
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = setup_logger(__name__)
@@ -26,9 +104,18 @@ class WorkingAxeAnalyzer:
         self.timeout_per_page = config.get('analysis', {}).get('timeout_per_page', 90)
         self.max_retries = config.get('analysis', {}).get('max_retries', 2)
         self.retry_delay = config.get('analysis', {}).get('retry_delay', 5)
+        self.block_stylesheets = config.get('analysis', {}).get('block_stylesheets', False)
+        self.per_host_limit = config.get('analysis', {}).get('per_host_limit', self.max_workers)
+        self.page_hook_timeout = config.get('analysis', {}).get('page_hook_timeout', self.timeout_per_page)
         
         self.thread_pool = ThreadPoolExecutor(max_workers=self.max_workers)
         self._shutdown_registered = False
+        
+        # One long-lived browser per worker thread, reused across pages; all are tracked for shutdown
+        self._driver_local = threading.local()
+        self._drivers: List[webdriver.Chrome] = []
+        self._drivers_lock = threading.Lock()
+        _live_analyzers.add(self)
     
     def _setup_driver(self) -> webdriver.Chrome:
         """Setup Chrome driver with optimized settings"""
@@ -48,11 +135,12 @@ class WorkingAxeAnalyzer:
         chrome_options.add_argument('--disable-images')  # Disable images for faster loading
         chrome_options.add_argument('--blink-settings=imagesEnabled=false')
         
-        # Timeout settings
-        chrome_options.add_argument('--page-load-strategy=eager')  # Don't wait for full page load
+        # Return from get() at DOMContentLoaded instead of window.onload; this is a WebDriver
+        # capability, so Chrome would ignore it as a command-line switch
+        chrome_options.page_load_strategy = 'eager'
         
         # Initialize driver with service
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         
         driver = webdriver.Chrome(
             service=service,
@@ -61,26 +149,102 @@ class WorkingAxeAnalyzer:
         
         # Set timeouts
         driver.set_page_load_timeout(30)  # 30 seconds for page load
-        driver.implicitly_wait(10)  # 10 seconds for element finding
+        driver.implicitly_wait(0)  # Element lookups return immediately; waits are explicit
         
+        # Have Chrome evaluate axe-core in every new document, so it is sent once per browser
+        # instead of once per page
+        try:
+            driver.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument',
+                {'source': self._get_axe_source(Axe(driver).script_url)}
+            )
+        except Exception as e:
+            self.logger.debug(f"axe-core preload unavailable, injecting per page: {e}")
+        
+        # Skip downloading fonts, media and image bytes the page load would otherwise wait on
+        blocked_urls = _BLOCKED_ASSET_URLS + (_BLOCKED_STYLESHEET_URLS if self.block_stylesheets else [])
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+        except Exception as e:
+            self.logger.debug(f"Asset blocking unavailable: {e}")
+        
+        return driver
+    
+    @staticmethod
+    def _parse_axe_json(raw: str) -> Dict[str, Any]:
+        """Decode the JSON string returned by the axe-core run script"""
+        return orjson.loads(raw) if orjson else json.loads(raw)
+    
+    @classmethod
+    def _get_axe_source(cls, script_url: str) -> str:
+        """Return the axe-core script, reading the bundled file on first use"""
+        with cls._axe_source_lock:
+            if cls._axe_source is None:
+                with open(script_url, 'r', encoding='utf8') as f:
+                    cls._axe_source = f.read()
+            return cls._axe_source
+    
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return this worker thread's browser, starting one on first use"""
+        driver = getattr(self._driver_local, 'driver', None)
+        if driver is None:
+            driver = self._setup_driver()
+            self._driver_local.driver = driver
+            with self._drivers_lock:
+                self._drivers.append(driver)
         return driver
     
-    def _run_selenium_axe_analysis(self, url: str, retry_count: int = 0) -> PageAuditResult:
-        """Run axe analysis with retry logic"""
+    def _reset_driver(self, driver: webdriver.Chrome):
+        """Clear page state so the browser can be reused for the next URL"""
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+    
+    def _discard_driver(self):
+        """Quit this worker thread's browser so the next page starts a fresh one"""
+        driver = getattr(self._driver_local, 'driver', None)
+        if driver is None:
+            return
+        self._driver_local.driver = None
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error quitting driver: {e}")
+    
+    def _run_selenium_axe_analysis(self, url: str, retry_count: int = 0,
+                                   page_hook: Optional[Callable[[webdriver.Chrome, str], None]] = None,
+                                   on_result: Optional[Callable[[PageAuditResult], None]] = None) -> PageAuditResult:
+        """Run axe analysis with retry logic
+        
+        page_hook, if given, is called with the driver and URL after a successful analysis
+        so further audits can reuse the loaded page instead of opening it again. on_result
+        receives the axe result before the hook runs, so callers need not wait for the hook.
+        """
         start_time = time.time()
+        # Formatted once and shared by whichever result this attempt returns
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
         driver = None
         
         try:
             self.logger.info(f"Starting analysis for: {url} (attempt {retry_count + 1})")
             
-            driver = self._setup_driver()
+            driver = self._get_driver()
             
             # Navigate to URL with timeout
             self.logger.info(f"Navigating to: {url}")
             driver.get(url)
             
-            # Wait for page to be interactive
-            time.sleep(2)  # Reduced wait time
+            # Wait for page to be interactive; returns as soon as the document is parsed, checked
+            # every 100ms rather than WebDriverWait's default 500ms
+            try:
+                WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                    lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+                )
+            except TimeoutException:
+                self.logger.warning(f"Page not interactive after 5s, analyzing current state: {url}")
             
             # Get page title before running axe analysis
             page_title = driver.title
@@ -89,50 +253,44 @@ class WorkingAxeAnalyzer:
             # Initialize and run axe
             self.logger.info(f"Running axe-core analysis for: {url}")
             axe = Axe(driver)
-            axe.inject()
-            results = axe.run()
+            if not driver.execute_script("return typeof window.axe !== 'undefined';"):
+                # Not preloaded on this page: send the cached source instead of re-reading the file
+                driver.execute_script(self._get_axe_source(axe.script_url))
+            results = self._parse_axe_json(driver.execute_async_script(_AXE_RUN_SCRIPT, AXE_RUN_OPTIONS))
+            if 'error' in results:
+                raise AnalysisException(f"axe-core run failed: {results['error']}")
             
-            load_time = time.time() - start_time
+            audit_result = self._build_page_result(url, page_title, results, start_time, timestamp)
             
-            # Parse results
-            violations = self._parse_violations(results.get('violations', []))
-            passes = results.get('passes', [])
-            incomplete = results.get('incomplete', [])
-            inapplicable = results.get('inapplicable', [])
+            if on_result:
+                on_result(audit_result)
             
-            audit_result = PageAuditResult(
-                url=url,
-                page_title=page_title,  # Add page title
-                timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
-                violations=violations,
-                passes=passes,
-                incomplete=incomplete,
-                inapplicable=inapplicable,
-                load_time=load_time
-            )
-            
-            self.logger.info(
-                f"Analysis completed for {url}: "
-                f"{len(violations)} violations, "
-                f"score: {audit_result.score:.1f}, "
-                f"time: {load_time:.2f}s"
-            )
+            # Let further audits reuse the loaded page
+            if page_hook:
+                try:
+                    page_hook(driver, url)
+                except Exception as e:
+                    self.logger.warning(f"Page hook failed for {url}: {e}")
             
             return audit_result
             
         except TimeoutException:
             self.logger.warning(f"Page load timeout for {url} (attempt {retry_count + 1})")
             
+            # The browser may be stuck on the page; replace it
+            self._discard_driver()
+            driver = None
+            
             # Retry logic
             if retry_count < self.max_retries:
                 self.logger.info(f"Retrying {url} after {self.retry_delay}s delay...")
                 time.sleep(self.retry_delay + random.uniform(1, 3))  # Add jitter
-                return self._run_selenium_axe_analysis(url, retry_count + 1)
+                return self._run_selenium_axe_analysis(url, retry_count + 1, page_hook, on_result)
             else:
                 return PageAuditResult(
                     url=url,
                     page_title="Error - Page load timeout",  # Add error page title
-                    timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+                    timestamp=timestamp,
                     violations=[],
                     passes=[],
                     incomplete=[],
@@ -143,16 +301,18 @@ class WorkingAxeAnalyzer:
                 
         except WebDriverException as e:
             self.logger.error(f"WebDriver error for {url}: {e}")
+            self._discard_driver()
+            driver = None
             
             if retry_count < self.max_retries:
                 self.logger.info(f"Retrying {url} after WebDriver error...")
                 time.sleep(self.retry_delay)
-                return self._run_selenium_axe_analysis(url, retry_count + 1)
+                return self._run_selenium_axe_analysis(url, retry_count + 1, page_hook, on_result)
             else:
                 return PageAuditResult(
                     url=url,
                     page_title="Error - WebDriver exception",  # Add error page title
-                    timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+                    timestamp=timestamp,
                     violations=[],
                     passes=[],
                     incomplete=[],
@@ -163,10 +323,12 @@ class WorkingAxeAnalyzer:
                 
         except Exception as e:
             self.logger.error(f"Unexpected error analyzing {url}: {e}")
+            self._discard_driver()
+            driver = None
             return PageAuditResult(
                 url=url,
                 page_title="Error - Analysis failed",  # Add error page title
-                timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+                timestamp=timestamp,
                 violations=[],
                 passes=[],
                 incomplete=[],
@@ -176,11 +338,44 @@ class WorkingAxeAnalyzer:
             )
             
         finally:
+            # Keep the healthy browser for this worker's next page
             if driver:
                 try:
-                    driver.quit()
+                    self._reset_driver(driver)
                 except Exception as e:
-                    self.logger.warning(f"Error quitting driver: {e}")
+                    self.logger.warning(f"Error resetting driver, replacing it: {e}")
+                    self._discard_driver()
+    
+    def _build_page_result(self, url: str, page_title: str, results: Dict[str, Any],
+                           start_time: float, timestamp: Optional[str] = None) -> PageAuditResult:
+        """Turn raw axe-core results into a PageAuditResult and log it"""
+        load_time = time.time() - start_time
+        
+        # Parse results
+        violations = self._parse_violations(results.get('violations', []))
+        passes = results.get('passes', [])
+        incomplete = results.get('incomplete', [])
+        inapplicable = results.get('inapplicable', [])
+        
+        audit_result = PageAuditResult(
+            url=url,
+            page_title=page_title,  # Add page title
+            timestamp=timestamp or time.strftime('%Y-%m-%d %H:%M:%S'),
+            violations=violations,
+            passes=passes,
+            incomplete=incomplete,
+            inapplicable=inapplicable,
+            load_time=load_time
+        )
+        
+        self.logger.info(
+            f"Analysis completed for {url}: "
+            f"{len(violations)} violations, "
+            f"score: {audit_result.score:.1f}, "
+            f"time: {load_time:.2f}s"
+        )
+        
+        return audit_result
     
     def _parse_violations(self, axe_violations: List[Dict[str, Any]]) -> List[Violation]:
         """Convert axe violations to our Violation model"""
@@ -204,21 +399,49 @@ class WorkingAxeAnalyzer:
         
         return violations
     
-    async def analyze_page(self, url: str) -> PageAuditResult:
-        """Analyze a single page with timeout protection"""
+    async def analyze_page(self, url: str,
+                           page_hook: Optional[Callable[[webdriver.Chrome, str], None]] = None) -> PageAuditResult:
+        """Analyze a single page with timeout protection
+        
+        timeout_per_page covers loading the page and running axe-core. page_hook runs after
+        that under its own page_hook_timeout, and its outcome never replaces the axe result.
+        """
         loop = asyncio.get_event_loop()
+        axe_result = loop.create_future()
+        
+        def publish(result: PageAuditResult):
+            # Called from the worker thread once axe-core is done, before the hook runs
+            try:
+                loop.call_soon_threadsafe(lambda: axe_result.done() or axe_result.set_result(result))
+            except RuntimeError:
+                pass  # Loop already closed; nobody is waiting for this page any more
         
         try:
-            # Use run_in_executor with timeout
-            result = await asyncio.wait_for(
-                loop.run_in_executor(
-                    self.thread_pool, 
-                    self._run_selenium_axe_analysis, 
-                    url
-                ),
-                timeout=self.timeout_per_page
+            work = loop.run_in_executor(
+                self.thread_pool, 
+                self._run_selenium_axe_analysis, 
+                url,
+                0,
+                page_hook,
+                publish if page_hook else None
             )
-            return result
+            
+            # Failed analyses come back through work; successful ones are published first
+            done, _ = await asyncio.wait(
+                {axe_result, work}, timeout=self.timeout_per_page, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                work.cancel()
+                raise asyncio.TimeoutError()
+            if work in done:
+                return work.result()
+            
+            # Keep this page's worker slot until the hook is done with the browser, so the
+            # caller does not see the page as finished while the hook still drives it
+            _, pending = await asyncio.wait({work}, timeout=self.page_hook_timeout)
+            if pending:
+                self.logger.warning(f"Page hook still running for {url} after {self.page_hook_timeout}s, keeping the axe result")
+            return axe_result.result()
             
         except asyncio.TimeoutError:
             self.logger.error(f"Analysis timed out for {url} (overall timeout)")
@@ -247,45 +470,16 @@ class WorkingAxeAnalyzer:
                 load_time=0
             )
     
-    async def analyze_multiple_pages(self, urls: List[str]) -> List[PageAuditResult]:
+    async def analyze_multiple_pages(self, urls: List[str],
+                                     page_hook: Optional[Callable[[webdriver.Chrome, str], None]] = None) -> List[PageAuditResult]:
         """Analyze multiple pages with improved concurrency control"""
         self.logger.info(f"Starting analysis for {len(urls)} pages with {self.max_workers} workers")
         
-        # Process URLs in batches to avoid overwhelming the system
-        batch_size = self.max_workers * 2
-        all_results = []
-        
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i:i + batch_size]
-            self.logger.info(f"Processing batch {i//batch_size + 1}/{(len(urls)-1)//batch_size + 1} ({len(batch)} URLs)")
-            
-            # Create tasks for current batch
-            tasks = [self.analyze_page(url) for url in batch]
-            
-            # Wait for all tasks in batch to complete
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process batch results
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"Analysis task failed for {batch[j]}: {result}")
-                    all_results.append(PageAuditResult(
-                        url=batch[j],
-                        page_title="Error - Task execution failed",  # Add error page title
-                        timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
-                        violations=[],
-                        passes=[],
-                        incomplete=[],
-                        inapplicable=[],
-                        error=str(result),
-                        load_time=0
-                    ))
-                else:
-                    all_results.append(result)
-            
-            # Small delay between batches to avoid overwhelming the system
-            if i + batch_size < len(urls):
-                await asyncio.sleep(1)
+        # Pages run as workers free up rather than in batches, so one slow page no longer
+        # holds back the rest of its batch; results are put back in URL order at the end
+        url_positions = {url: position for position, url in enumerate(urls)}
+        all_results = [result async for result in self.analyze_pages_stream(urls, page_hook)]
+        all_results.sort(key=lambda result: url_positions.get(result.url, len(urls)))
         
         # Final statistics
         successful = len([r for r in all_results if not r.error])
@@ -298,47 +492,60 @@ class WorkingAxeAnalyzer:
         
         return all_results
     
+    async def analyze_pages_stream(self, urls: List[str],
+                                   page_hook: Optional[Callable[[webdriver.Chrome, str], None]] = None) -> AsyncIterator[PageAuditResult]:
+        """Analyze pages concurrently and yield each result as soon as it completes
+        
+        At most max_workers pages are in flight, and at most per_host_limit of them on one
+        host, so workers spread across sites instead of all hitting the same origin. A queued
+        page's timeout only starts once it has a worker. Results arrive in completion order,
+        not URL order.
+        """
+        self.logger.info(f"Starting streamed analysis for {len(urls)} pages with {self.max_workers} workers")
+        semaphore = asyncio.Semaphore(self.max_workers)
+        host_semaphores = defaultdict(lambda: asyncio.Semaphore(max(1, self.per_host_limit)))
+        
+        async def analyze(url: str) -> PageAuditResult:
+            # Take the host slot first so pages waiting on a busy host do not hold a worker
+            async with host_semaphores[urlparse(url).netloc], semaphore:
+                try:
+                    return await self.analyze_page(url, page_hook)
+                except Exception as e:
+                    # Shield the stream so one failed task does not end it for every other page
+                    self.logger.error(f"Analysis task failed for {url}: {e}")
+                    return PageAuditResult(
+                        url=url,
+                        page_title="Error - Task execution failed",
+                        timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+                        violations=[],
+                        passes=[],
+                        incomplete=[],
+                        inapplicable=[],
+                        error=str(e),
+                        load_time=0
+                    )
+        
+        for next_result in asyncio.as_completed([analyze(url) for url in urls]):
+            yield await next_result
+    
     def generate_audit_report(self, audit_results: List[PageAuditResult]) -> Dict[str, Any]:
         """Generate comprehensive audit report with page titles"""
-        successful_results = [r for r in audit_results if not r.error]
-        failed_results = [r for r in audit_results if r.error]
+        # Partition once and share it with the summary instead of each re-scanning the results
+        successful_results, failed_results = [], []
+        for result in audit_results:
+            (failed_results if result.error else successful_results).append(result)
         
-        summary = self.categorizer.generate_summary(audit_results)
+        summary = self.categorizer.generate_summary(audit_results, successful_results, failed_results)
         
         # Get detailed categorization
-        all_violations = []
-        for result in successful_results:
-            all_violations.extend(result.violations)
+        all_violations = [v for result in successful_results for v in result.violations]
         
         categorization = self.categorizer.categorize_violations(all_violations)
         
         report = {
             'summary': summary.to_dict(),
             'categorization': categorization,
-            'page_results': [
-                {
-                    'url': result.url,
-                    'page_title': result.page_title,  # Include page title in report
-                    'score': result.score,
-                    'violation_count': len(result.violations),
-                    'error': result.error,
-                    'load_time': round(result.load_time, 2),
-                    'timestamp': result.timestamp,
-                    'violations': [
-                        {
-                            'id': v.id,
-                            'impact': v.impact,
-                            'level': v.level.value if hasattr(v.level, 'value') else str(v.level),
-                            'description': v.description,
-                            'help': v.help,
-                            'help_url': v.help_url,
-                            'nodes_count': len(v.nodes),
-                            'tags': v.tags,  # Include tags for WCAG criteria extraction
-                            'nodes': v.nodes  # Include nodes for element selector extraction
-                        } for v in result.violations
-                    ]
-                } for result in audit_results
-            ],
+            'page_results': [_page_to_dict(result) for result in audit_results],
             'metadata': {
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'total_pages_analyzed': len(audit_results),
@@ -355,10 +562,22 @@ class WorkingAxeAnalyzer:
         return report
     
     def shutdown(self):
-        """Properly shutdown the thread pool"""
+        """Properly shutdown the thread pool and quit the reused browsers"""
         if hasattr(self, 'thread_pool') and self.thread_pool:
             self.thread_pool.shutdown(wait=True)
             self._shutdown_registered = True
+        
+        self._quit_drivers()
+    
+    def _quit_drivers(self):
+        """Quit every browser this analyzer started"""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.logger.warning(f"Error quitting driver: {e}")
     
     def __del__(self):
         """Clean up thread pool"""
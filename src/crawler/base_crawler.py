@@ -12,6 +12,11 @@ class BaseCrawler(ABC):
         self.visited_urls: Set[str] = set()
         self.discovered_urls: Set[str] = set()
         
+        # URL filters are fixed for the crawl, so normalize them once instead of on every check
+        crawler_config = config.get('crawler', {})
+        self._avoided_extensions = tuple(ext.lower() for ext in crawler_config.get('file_extensions_to_avoid') or ())
+        self._allowed_domains = frozenset(crawler_config.get('allowed_domains') or ())
+        
     @abstractmethod
     async def crawl(self, start_url: str) -> List[str]:
         """Crawl website starting from given URL"""
@@ -25,20 +30,18 @@ class BaseCrawler(ABC):
     def should_crawl_url(self, url: str) -> bool:
         """Check if URL should be crawled based on configuration"""
         try:
+            # Check if already visited; the cheapest test, and it skips parsing entirely
+            if url in self.visited_urls:
+                return False
+            
             parsed_url = urlparse(url)
             
             # Check file extensions to avoid
-            if any(parsed_url.path.lower().endswith(ext) 
-                   for ext in self.config['crawler']['file_extensions_to_avoid']):
-                return False
-            
-            # Check if already visited
-            if url in self.visited_urls:
+            if parsed_url.path.lower().endswith(self._avoided_extensions):
                 return False
             
             # Check domain restrictions
-            allowed_domains = self.config['crawler']['allowed_domains']
-            if allowed_domains and parsed_url.netloc not in allowed_domains:
+            if self._allowed_domains and parsed_url.netloc not in self._allowed_domains:
                 return False
             
             return True
@@ -1,12 +1,20 @@
 # src/utils/report_writer.py
 import json
 import pandas as pd
+from dataclasses import fields, is_dataclass
+from enum import Enum
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import os
 from ..utils.logger import setup_logger
 
+# orjson is optional; when installed, JSON reports are encoded in C several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ReportWriter:
     def __init__(self, base_output_dir: str = "storage/reports"):
         self.base_output_dir = Path(base_output_dir)
@@ -41,12 +49,19 @@ class ReportWriter:
             
             file_path = self.json_dir / filename
             
-            # Make sure data is JSON serializable
-            serializable_data = self._make_serializable(data)
-            
-            # Save as JSON
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(serializable_data, f, indent=2, ensure_ascii=False)
+            # Save as JSON; unsupported objects are converted by _json_default as the encoder
+            # reaches them, so the data is not copied into a serializable tree first. Both
+            # encoders produce the whole document in memory, which is written with one call
+            # rather than json.dump's many small chunk writes
+            if orjson is not None:
+                content = orjson.dumps(
+                    data, default=self._json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                content = json.dumps(
+                    data, indent=2, ensure_ascii=False, default=self._json_default
+                ).encode('utf-8')
+            file_path.write_bytes(content)
             
             self.logger.info(f"JSON report saved to: {file_path}")
             return str(file_path)
@@ -171,17 +186,16 @@ class ReportWriter:
                 items.append((new_key, v))
         return dict(items)
     
-    def _make_serializable(self, obj: Any) -> Any:
-        """Convert non-serializable objects to serializable formats"""
-        if isinstance(obj, dict):
-            return {k: self._make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif isinstance(obj, (str, int, float, bool)) or obj is None:
-            return obj
+    def _json_default(self, obj: Any) -> Any:
+        """Convert an object the JSON encoder cannot handle natively"""
+        if isinstance(obj, Enum):
+            return obj.value
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclasses have no __dict__; read their declared fields
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
         elif hasattr(obj, '__dict__'):
             # Convert objects to dict
-            return self._make_serializable(obj.__dict__)
+            return obj.__dict__
         else:
             # Convert to string as fallback
             return str(obj)
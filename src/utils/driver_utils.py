@@ -0,0 +1,16 @@
+import os
+import threading
+from typing import Optional
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Resolved chromedriver binary, shared by every browser the process starts
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+def get_chromedriver_path() -> str:
+    """Resolve the chromedriver binary, hitting webdriver_manager only when not cached"""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if not _chromedriver_path or not os.path.isfile(_chromedriver_path):
+            _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path